@@ -20,6 +20,7 @@ a = Analysis(
         'reportlab.pdfgen',
         'reportlab.pdfgen.canvas',
         'bs4',
+        'lxml',
         'requests',
         'configparser',
     ],
@@ -3,11 +3,17 @@ import requests
 import configparser
 import shutil
 import re
-from typing import Optional, Dict, List, DefaultDict
-from collections import defaultdict
-from urllib.parse import urlparse
+import threading
+import weakref
+from concurrent.futures import ThreadPoolExecutor, wait
+from contextlib import ExitStack, contextmanager
+from functools import lru_cache
+from typing import Optional, Dict, List, DefaultDict, Set
+from collections import defaultdict, OrderedDict
+from urllib.parse import urlparse, parse_qs, urlencode
 from bs4 import BeautifulSoup
-from bs4.element import Tag, NavigableString
+import lxml.html
+from lxml import etree
 from reportlab.lib.pagesizes import letter
 from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
 from reportlab.platypus import (
@@ -20,17 +26,28 @@ from reportlab.platypus import (
 )
 from reportlab.platypus.tableofcontents import TableOfContents
 from reportlab.lib.units import inch
+from reportlab.pdfbase.pdfmetrics import stringWidth
 from reportlab.lib.colors import blue, HexColor
 from google.auth.transport.requests import Request
 from google.oauth2.credentials import Credentials
 from google_auth_oauthlib.flow import InstalledAppFlow
 from googleapiclient.discovery import build
-from googleapiclient.http import MediaFileUpload
+from googleapiclient.http import MediaFileUpload, MediaIoBaseUpload
 from googleapiclient.errors import HttpError
-from datetime import datetime
+from datetime import datetime, timezone
+import hashlib
 import html
+import io
+from email.utils import parsedate_to_datetime
+import mimetypes
 import json
+import atexit
+import logging
+import queue
+import sys
+from logging.handlers import QueueHandler, QueueListener
 from urllib3.util.retry import Retry
+from urllib3.exceptions import HTTPError as Urllib3Error
 from requests.adapters import HTTPAdapter
 
 
@@ -39,7 +56,11 @@ SCOPES = ["https://www.googleapis.com/auth/drive"]
 CONFIG_FILE = "config.ini"
 GOOGLE_CREDS_FILE = "credentials.json"
 GOOGLE_TOKEN_FILE = "token.json"
+# Canvas updated_at of every file/page already synced to Drive, kept between runs
+SYNC_STATE_FILE = ".canvas_sync_state.json"
 DOWNLOAD_DIR = "temp_canvas_downloads"
+# Temp folder name used inside LOCAL_ROOT_DIR so finished files can be renamed into place
+LOCAL_DOWNLOAD_DIR_NAME = ".tmp_canvas_downloads"
 
 # Performance tuning defaults (overridable via config.ini [PERFORMANCE])
 DEFAULT_REQUEST_TIMEOUT = 20  # seconds
@@ -48,25 +69,236 @@ DEFAULT_BACKOFF_FACTOR = 0.5
 DEFAULT_CANVAS_PER_PAGE = 100
 DEFAULT_HTTP_POOL_MAXSIZE = 20
 DEFAULT_DRIVE_CHUNK_SIZE_MB = 8
+# Canvas files up to this size are piped to Drive through memory instead of a temp file.
+# Every file worker of every course worker may hold one such buffer, so keep it small.
+DRIVE_STREAM_UPLOAD_MAX_BYTES = 4 * 1024 * 1024
+# Files below this size go to Drive as one multipart request instead of a resumable session
+DRIVE_SIMPLE_UPLOAD_MAX_BYTES = 5 * 1024 * 1024
+DRIVE_LIST_PAGE_SIZE = 1000
+# Parent folders OR-ed into one files().list query when warming folder indexes
+DRIVE_INDEX_PARENTS_PER_QUERY = 40
+# Drive rejects batch requests with more than 100 calls
+DRIVE_BATCH_SIZE = 100
+DRIVE_FOLDER_MIME_TYPE = "application/vnd.google-apps.folder"
+# Retries (with exponential backoff) for Drive 5xx/429/rate-limit 403 responses
+DRIVE_NUM_RETRIES = 5
+DEFAULT_FILE_WORKERS = 4
+DEFAULT_COURSE_WORKERS = 4
+DEFAULT_PAGINATION_WORKERS = 8
+DEFAULT_PAGE_FETCH_WORKERS = 16
+DOWNLOAD_CHUNK_SIZE = 1024 * 1024  # 1 MiB
+# Write title-only assignment PDFs directly instead of laying them out with ReportLab
+MINIMAL_ASSIGNMENT_PDF_FAST_PATH = True
+
+# Characters that are not allowed in file/folder names
+_SANITIZE_RE = re.compile(r'[\\/*?:"<>|]')
+
+# Canvas file references (/files/<id>) in description/page HTML
+_FILE_LINK_RE = re.compile(r"/files/(\d+)")
+
+# Guards the check-then-add on processed Canvas file IDs across worker threads
+_PROCESSED_IDS_LOCK = threading.Lock()
+# Per-thread state (e.g. Drive service clones for worker threads)
+_THREAD_LOCAL = threading.local()
+# Credentials from get_drive_service(); worker threads build their own Drive clients
+_drive_credentials: Optional[Credentials] = None
+
+# Per-run cache of Drive folder listings: { folder_id: { filename: metadata } }
+_drive_folder_index: Dict[str, Dict[str, dict]] = {}
+_DRIVE_INDEX_LOCK = threading.Lock()
+
+# Per-run cache of resolved Drive folders: { (parent_id, name): folder_id }
+_drive_folder_ids: Dict[tuple, str] = {}
+# One lock per (parent_id, name) so concurrent courses never create the same folder twice
+_drive_folder_locks: Dict[tuple, threading.Lock] = {}
+_DRIVE_FOLDER_LOCKS_LOCK = threading.Lock()
+
+# Per-run cache of Canvas file metadata: { file_id: file_info }
+_canvas_file_infos: Dict[str, dict] = {}
+
+# Per-run set of local folders already created or found by get_or_create_local_folder
+_local_folder_paths: Set[str] = set()
+
+# Parsed config.ini, loaded once by _get_config()
+_config: Optional[configparser.ConfigParser] = None
+
+# Module-wide pooled session; main() configures it, helpers fall back to it
+_SESSION: Optional[requests.Session] = None
+# (max_retries, backoff_factor, pool_maxsize) the shared session was built with
+_SESSION_KEY: Optional[tuple] = None
+_SESSION_LOCK = threading.Lock()
+
+# Progress and error messages; see configure_console_logging()
+logger = logging.getLogger(__name__)
+# Listener started by start_background_logging(); None while logging is direct
+_log_listener: Optional[QueueListener] = None
 
 
 # --- Helper Functions ---
+class _CourseLogFilter(logging.Filter):
+    """Stamps each record with the course its thread is syncing (see log_course)."""
+
+    def filter(self, record):
+        record.course = getattr(_THREAD_LOCAL, "log_course", None)
+        return True
+
+
+class _CourseLogFormatter(logging.Formatter):
+    """Prefixes records logged under log_course() with "[course] "."""
+
+    def format(self, record):
+        message = super().format(record)
+        course = getattr(record, "course", None)
+        if not course:
+            return message
+        # Keep leading blank lines (section breaks) ahead of the prefix
+        text = message.lstrip("\n")
+        return f"{message[: len(message) - len(text)]}[{course}] {text}"
+
+
+_COURSE_LOG_FILTER = _CourseLogFilter()
+
+
+def configure_console_logging():
+    """Sends this module's log records to stdout as plain lines, like print()."""
+    handler = logging.StreamHandler(sys.stdout)
+    handler.setFormatter(_CourseLogFormatter("%(message)s"))
+    logger.handlers = [handler]
+    logger.setLevel(logging.INFO)
+    logger.propagate = False
+    if _COURSE_LOG_FILTER not in logger.filters:
+        logger.addFilter(_COURSE_LOG_FILTER)
+
+
+@contextmanager
+def log_course(course_name: Optional[str]):
+    """Prefixes this thread's log lines with course_name while the block runs.
+
+    Used when several courses sync at once so their interleaved output can be
+    told apart; None leaves lines unprefixed.
+    """
+    previous = getattr(_THREAD_LOCAL, "log_course", None)
+    _THREAD_LOCAL.log_course = course_name
+    try:
+        yield
+    finally:
+        _THREAD_LOCAL.log_course = previous
+
+
+def _in_log_course(fn):
+    """Wraps fn so it logs under the calling thread's course when run on a pool."""
+    course_name = getattr(_THREAD_LOCAL, "log_course", None)
+
+    def run(*args, **kwargs):
+        with log_course(course_name):
+            return fn(*args, **kwargs)
+
+    return run
+
+
+def start_background_logging() -> QueueListener:
+    """Moves console output onto a background thread for the sync phase.
+
+    Logging calls then only enqueue a record, so the sync loop and its workers
+    never block on terminal I/O. Call stop_background_logging() before printing
+    or prompting directly again; it also runs at exit so queued messages are not
+    lost if the sync dies with an exception. Returns the running listener if
+    background logging is already on.
+    """
+    global _log_listener
+    if _log_listener is not None:
+        return _log_listener
+    log_queue = queue.SimpleQueue()
+    listener = QueueListener(log_queue, *logger.handlers)
+    logger.handlers = [QueueHandler(log_queue)]
+    listener.start()
+    _log_listener = listener
+    atexit.register(stop_background_logging)
+    return listener
+
+
+def stop_background_logging(listener: Optional[QueueListener] = None):
+    """Drains the log queue and writes to the console directly again.
+
+    Defaults to the running listener; does nothing if it was already stopped.
+    """
+    global _log_listener
+    if listener is None:
+        listener = _log_listener
+    if listener is None or listener is not _log_listener:
+        return
+    _log_listener = None
+    atexit.unregister(stop_background_logging)
+    listener.stop()
+    logger.handlers = list(listener.handlers)
+
+
+def get_shared_session(
+    max_retries: Optional[int] = None,
+    backoff_factor: Optional[float] = None,
+    pool_maxsize: Optional[int] = None,
+) -> requests.Session:
+    """Returns a module-wide pooled Session so callers without one still reuse connections.
+
+    Without arguments the current session is returned (built with the defaults
+    on first use). main() passes its [PERFORMANCE] settings; the session is only
+    rebuilt when they differ from the ones it was built with, so repeated runs in
+    one process keep their pooled connections.
+    """
+    global _SESSION, _SESSION_KEY
+    with _SESSION_LOCK:
+        if _SESSION is not None and (
+            max_retries is None and backoff_factor is None and pool_maxsize is None
+        ):
+            return _SESSION
+        key = (
+            DEFAULT_MAX_RETRIES if max_retries is None else max_retries,
+            DEFAULT_BACKOFF_FACTOR if backoff_factor is None else backoff_factor,
+            DEFAULT_HTTP_POOL_MAXSIZE if pool_maxsize is None else pool_maxsize,
+        )
+        if _SESSION is None or _SESSION_KEY != key:
+            retries = Retry(
+                total=key[0],
+                backoff_factor=key[1],
+                status_forcelist=(429, 500, 502, 503, 504),
+                allowed_methods=frozenset(["GET", "HEAD"]),
+                raise_on_status=False,
+            )
+            # Concurrent course/file/page workers wait for a free connection
+            # instead of opening (and discarding) connections beyond the pool size
+            adapter = HTTPAdapter(
+                max_retries=retries,
+                pool_connections=key[2],
+                pool_maxsize=key[2],
+                pool_block=True,
+            )
+            if _SESSION is not None:
+                _SESSION.close()
+            _SESSION = requests.Session()
+            _SESSION.mount("http://", adapter)
+            _SESSION.mount("https://", adapter)
+            _SESSION_KEY = key
+        return _SESSION
+
+
 class SummaryCollector:
     """Collects a per-course summary of updated/created files grouped by destination folder label."""
 
     def __init__(self):
         # Structure: { course_name: { dest_label: [ (filename, action) ] } }
-        self.per_course: Dict[str, DefaultDict[str, List[tuple]]] = {}
+        self.per_course: DefaultDict[str, DefaultDict[str, List[tuple]]] = defaultdict(
+            lambda: defaultdict(list)
+        )
+        self._lock = threading.Lock()
 
     def add_file(self, course_name: str, dest_label: str, filename: str, action: str):
         if not course_name or not dest_label or not filename:
             return
-        if course_name not in self.per_course:
-            self.per_course[course_name] = defaultdict(list)
-        self.per_course[course_name][dest_label].append((filename, action))
+        with self._lock:
+            self.per_course[course_name][dest_label].append((filename, action))
 
     def has_changes(self) -> bool:
-        return any(self.per_course.get(c) for c in self.per_course)
+        return any(self.per_course.values())
 
     def print_summary(self):
         print("\n=== Summary of Updates ===")
@@ -82,34 +314,172 @@ class SummaryCollector:
         print("\n==========================")
 
 
+class SyncState:
+    """Remembers which Canvas version of each Drive file was last synced.
+
+    Entries are keyed by "<folder_id>/<filename>" and hold the Canvas updated_at
+    (and size, for files; a content hash, for page PDFs). When Canvas reports the
+    same values on the next run, the file is skipped without listing its Drive
+    folder. Delete SYNC_STATE_FILE to force every file to be compared against
+    Drive again.
+    """
+
+    def __init__(self):
+        self.entries: Dict[str, list] = {}
+        self._lock = threading.Lock()
+
+    def load(self, path: str):
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                entries = json.load(f)
+        except FileNotFoundError:
+            return
+        except (OSError, ValueError) as e:
+            logger.warning(f"Warning: Ignoring unreadable sync state '{path}': {e}")
+            return
+        if isinstance(entries, dict):
+            with self._lock:
+                self.entries = entries
+
+    def is_unchanged(self, folder_id, filename, updated_at, size=None) -> bool:
+        if not updated_at:
+            return False
+        with self._lock:
+            entry = self.entries.get(f"{folder_id}/{filename}")
+        return entry is not None and entry[:2] == [updated_at, size]
+
+    def content_hash(self, folder_id, filename) -> Optional[str]:
+        with self._lock:
+            entry = self.entries.get(f"{folder_id}/{filename}")
+        return entry[2] if entry and len(entry) > 2 else None
+
+    def record(self, folder_id, filename, updated_at, size=None, content_hash=None):
+        if not updated_at:
+            return
+        with self._lock:
+            self.entries[f"{folder_id}/{filename}"] = [updated_at, size, content_hash]
+
+    def save(self, path: str):
+        with self._lock:
+            entries = dict(self.entries)
+        # Write to a temp file and swap it in, as save_last_selection does
+        tmp_path = f"{path}.tmp"
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(entries, f)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.warning(f"Warning: Could not save sync state '{path}': {e}")
+
+
+# Loaded by main() for Drive syncs; left empty (never matching) for local storage
+_sync_state = SyncState()
+
+
+@lru_cache(maxsize=4096)
 def sanitize_filename(name):
-    """Removes invalid characters from a string to make it a valid filename."""
-    return re.sub(r'[\\/*?:"<>|]', "", name).strip()
+    """Removes invalid characters from a string to make it a valid filename.
+
+    Cached because the same course, assignment and page names are sanitized
+    several times per run (folder batching, the item loop, the pages bundle).
+    """
+    return _SANITIZE_RE.sub("", name).strip()
+
+
+def _drive_file_metadata(file):
+    """Normalizes a Drive file resource into the metadata dict used for change checks."""
+    return {
+        "id": file.get("id"),
+        "size": int(file.get("size", 0)) if file.get("size") else 0,
+        "modified_time": file.get("modifiedTime"),
+    }
+
+
+def load_drive_folder_index(service, folder_id):
+    """Lists every file in a Drive folder once and returns {name: metadata}.
+
+    Returns None if the listing fails so the caller can avoid caching it.
+    """
+    try:
+        files = drive_list_all(
+            service,
+            f"'{folder_id}' in parents and trashed=false",
+            "files(id, name, size, modifiedTime)",
+        )
+    except HttpError as error:
+        logger.error(f"Error listing files in Drive folder '{folder_id}': {error}")
+        return None
+    index: Dict[str, dict] = {}
+    for file in files:
+        # Keep the first match, as the old per-name query did
+        index.setdefault(file.get("name"), _drive_file_metadata(file))
+    return index
+
+
+def prefetch_drive_folder_indexes(service, folder_ids):
+    """Loads the file listings of many Drive folders with a few OR-ed parent queries.
+
+    Used for sibling folders (e.g. one folder per assignment) so later
+    get_existing_file_metadata_drive calls hit the cache instead of listing each
+    folder separately. Folders that fail to list are left uncached.
+    """
+    pending = []
+    with _DRIVE_INDEX_LOCK:
+        for folder_id in dict.fromkeys(folder_ids):
+            if folder_id and folder_id not in _drive_folder_index:
+                pending.append(folder_id)
+    for start in range(0, len(pending), DRIVE_INDEX_PARENTS_PER_QUERY):
+        chunk = pending[start : start + DRIVE_INDEX_PARENTS_PER_QUERY]
+        parents_query = " or ".join(f"'{folder_id}' in parents" for folder_id in chunk)
+        try:
+            files = drive_list_all(
+                service,
+                f"({parents_query}) and trashed=false",
+                "files(id, name, size, modifiedTime, parents)",
+            )
+        except HttpError as error:
+            logger.error(f"Error listing files in Drive folders: {error}")
+            continue
+        indexes: Dict[str, Dict[str, dict]] = {folder_id: {} for folder_id in chunk}
+        for file in files:
+            for parent in file.get("parents", []):
+                if parent in indexes:
+                    indexes[parent].setdefault(
+                        file.get("name"), _drive_file_metadata(file)
+                    )
+        with _DRIVE_INDEX_LOCK:
+            for folder_id, index in indexes.items():
+                _drive_folder_index.setdefault(folder_id, index)
+
+
+def _get_drive_folder_index(service, folder_id):
+    """Returns the cached listing for a Drive folder, loading it on first use."""
+    with _DRIVE_INDEX_LOCK:
+        index = _drive_folder_index.get(folder_id)
+    if index is None:
+        index = load_drive_folder_index(service, folder_id)
+        if index is None:
+            return {}
+        with _DRIVE_INDEX_LOCK:
+            index = _drive_folder_index.setdefault(folder_id, index)
+    return index
+
+
+def _record_drive_file(folder_id, filename, file):
+    """Updates the cached folder listing after a file is created or updated."""
+    with _DRIVE_INDEX_LOCK:
+        index = _drive_folder_index.get(folder_id)
+        if index is not None:
+            index[filename] = _drive_file_metadata(file)
 
 
 def get_existing_file_metadata_drive(service, folder_id, filename):
     """Gets metadata of an existing file in Google Drive folder."""
     if not folder_id or not filename:
         return None
-    try:
-        escaped_name = filename.replace("'", "\\'")
-        query = f"name='{escaped_name}' and '{folder_id}' in parents and trashed=false"
-        response = (
-            service.files()
-            .list(q=query, fields="files(id, size, modifiedTime)")
-            .execute()
-        )
-        files = response.get("files", [])
-        if files:
-            file = files[0]  # Take the first if multiple
-            return {
-                "id": file.get("id"),
-                "size": int(file.get("size", 0)) if file.get("size") else 0,
-                "modified_time": file.get("modifiedTime"),
-            }
-    except HttpError as error:
-        print(f"Error fetching metadata for '{filename}': {error}")
-    return None
+    index = _get_drive_folder_index(service, folder_id)
+    with _DRIVE_INDEX_LOCK:
+        return index.get(filename)
 
 
 def get_existing_file_metadata_local(folder_path, filename):
@@ -117,328 +487,414 @@ def get_existing_file_metadata_local(folder_path, filename):
     if not folder_path or not filename:
         return None
     path = os.path.join(folder_path, filename)
-    if os.path.exists(path):
-        try:
-            return {
-                "size": os.path.getsize(path),
-                "modified_time": os.path.getmtime(path),
-            }
-        except OSError as error:
-            print(f"Error getting metadata for '{path}': {error}")
-    return None
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
+        return None
+    except OSError as error:
+        logger.error(f"Error getting metadata for '{path}': {error}")
+        return None
+    return {"size": st.st_size, "modified_time": st.st_mtime}
 
 
 def has_file_changed(existing_metadata, canvas_size=None, canvas_updated_at=None):
-    """Checks if file has changed based on metadata."""
+    """Checks if file has changed based on metadata.
+
+    Size is compared first since it is a cheap integer check; timestamps are only
+    parsed when the sizes match. Local metadata carries a POSIX mtime while Drive
+    carries an ISO string, so both are normalized to UTC before comparing; the
+    usual Canvas/Drive "Z" string pair is compared without parsing.
+    """
     if not existing_metadata:
         return True  # New file
     if canvas_size is not None and existing_metadata["size"] != canvas_size:
         return True
-    if canvas_updated_at and existing_metadata["modified_time"]:
-        # Compare timestamps, assuming canvas_updated_at is ISO format
-        from datetime import datetime
-
-        try:
-            canvas_time = datetime.fromisoformat(
-                canvas_updated_at.replace("Z", "+00:00")
-            )
-            existing_time = datetime.fromisoformat(
-                existing_metadata["modified_time"].replace("Z", "+00:00")
-            )
-            if canvas_time > existing_time:
-                return True
-        except ValueError:
-            pass  # If parsing fails, assume changed
+    existing_modified = existing_metadata["modified_time"]
+    if (
+        isinstance(canvas_updated_at, str)
+        and len(canvas_updated_at) == 20
+        and canvas_updated_at[-1] == "Z"
+        and isinstance(existing_modified, str)
+        and len(existing_modified) >= 20
+        and existing_modified[19] in ".Z"
+        and existing_modified[-1] == "Z"
+    ):
+        # Canvas "...:SSZ" vs Drive "...:SS.mmmZ": both UTC, so comparing the
+        # whole-second prefix decides it (equal seconds means Drive is not older)
+        return canvas_updated_at[:19] > existing_modified[:19]
+    if canvas_updated_at and isinstance(existing_modified, (int, float)):
+        # Local POSIX mtime: compare epoch seconds instead of building a second datetime
+        canvas_time = _parse_iso_utc(canvas_updated_at)
+        return canvas_time is not None and canvas_time.timestamp() > existing_modified
+    if canvas_updated_at and existing_modified:
+        canvas_time = _parse_iso_utc(canvas_updated_at)
+        existing_time = _to_utc_datetime(existing_modified)
+        # If either side fails to parse, treat the file as unchanged
+        if canvas_time and existing_time and canvas_time > existing_time:
+            return True
     return False
 
 
-def html_to_pdf_elements(html_content, base_styles):
-    """Convert HTML content to ReportLab flowables with formatting preserved."""
-    if not html_content:
-        return []
+# Tag kinds used by html_to_pdf_elements; one dict lookup per node selects the branch
+_TAG_KINDS = {
+    "p": "paragraph",
+    "div": "paragraph",
+    "h1": "heading",
+    "h2": "heading",
+    "h3": "heading",
+    "h4": "heading",
+    "h5": "heading",
+    "h6": "heading",
+    "blockquote": "blockquote",
+    "strong": "inline",
+    "b": "inline",
+    "em": "inline",
+    "i": "inline",
+    "u": "inline",
+    "a": "link",
+    "ul": "list",
+    "ol": "list",
+    "li": "item",
+    "pre": "preformatted",
+    "code": "preformatted",
+    "br": "break",
+}
+# Kinds that start a new block (and so close any pending top-level inline text)
+_BLOCK_KINDS = frozenset(
+    {"paragraph", "heading", "blockquote", "list", "item", "preformatted"}
+)
+# Inline formatting tags mapped to the style applied to their text
+_INLINE_STYLE_TAGS = {
+    "strong": "strong",
+    "b": "strong",
+    "em": "em",
+    "i": "em",
+    "u": "u",
+}
 
-    soup = BeautifulSoup(html_content, "html.parser")
-    elements = []
-    inline_buffer = ""  # Accumulates inline-only content to wrap into a paragraph
-
-    # Define styles for different HTML elements
-    styles = {
-        "p": base_styles["Normal"],
-        "h1": ParagraphStyle(
-            "h1", parent=base_styles["Heading1"], fontSize=18, spaceAfter=20
-        ),
-        "h2": ParagraphStyle(
-            "h2", parent=base_styles["Heading2"], fontSize=16, spaceAfter=18
-        ),
-        "h3": ParagraphStyle(
-            "h3", parent=base_styles["Heading3"], fontSize=14, spaceAfter=16
-        ),
-        "h4": ParagraphStyle(
-            "h4", parent=base_styles["Heading4"], fontSize=12, spaceAfter=14
-        ),
-        "h5": ParagraphStyle(
-            "h5",
-            parent=base_styles["Normal"],
-            fontSize=11,
-            fontName="Helvetica-Bold",
-            spaceAfter=12,
-        ),
-        "h6": ParagraphStyle(
-            "h6",
-            parent=base_styles["Normal"],
-            fontSize=10,
-            fontName="Helvetica-Bold",
-            spaceAfter=10,
-        ),
-        "strong": ParagraphStyle(
-            "strong", parent=base_styles["Normal"], fontName="Helvetica-Bold"
-        ),
-        "b": ParagraphStyle(
-            "b", parent=base_styles["Normal"], fontName="Helvetica-Bold"
-        ),
-        "em": ParagraphStyle(
-            "em", parent=base_styles["Normal"], fontName="Helvetica-Oblique"
-        ),
-        "i": ParagraphStyle(
-            "i", parent=base_styles["Normal"], fontName="Helvetica-Oblique"
-        ),
-        "u": ParagraphStyle("u", parent=base_styles["Normal"], underline=True),
-        "blockquote": ParagraphStyle(
-            "blockquote", parent=base_styles["Normal"], leftIndent=20, rightIndent=20
-        ),
-        "code": ParagraphStyle(
-            "code",
-            parent=base_styles["Normal"],
-            fontName="Courier",
-            fontSize=9,
-            backColor=HexColor("#f0f0f0"),
-        ),
-        "pre": ParagraphStyle(
-            "pre",
-            parent=base_styles["Normal"],
-            fontName="Courier",
-            fontSize=9,
-            leftIndent=10,
-        ),
-        "li": ParagraphStyle(
-            "li", parent=base_styles["Normal"], leftIndent=15, bulletIndent=5
-        ),
-    }
+# Parser backend for BeautifulSoup; lxml is a hard dependency and much faster
+# than the pure-Python html.parser on small fragments
+_BS_PARSER = "lxml"
 
-    def process_element(element, current_style=None):
-        """Recursively process HTML elements and convert to formatted text."""
-        if element is None:
-            return ""
+# Single-pass equivalent of html.escape(text, quote=False) for text runs
+_HTML_ESCAPE = str.maketrans({"&": "&amp;", "<": "&lt;", ">": "&gt;"})
 
-        if element.name is None:  # Text node
-            text = element.string
-            if text and text.strip():
-                # Escape HTML entities to prevent parsing errors
-                text = html.escape(text, quote=False)
-                if current_style:
-                    return f'<font name="{current_style.fontName}" size="{current_style.fontSize}">{text}</font>'
-                else:
-                    return text
-            return ""
 
-        # Handle different HTML elements
-        tag_name = element.name.lower()
+def _esc(text: str) -> str:
+    """Escape text for ReportLab paragraph markup (html.escape with quote=False)."""
+    return text.translate(_HTML_ESCAPE)
 
-        if tag_name in ["p", "div"]:
-            content = ""
-            for child in element.children:
-                child_result = process_element(child, current_style)
-                if child_result is not None:
-                    content += child_result
-            if content.strip():
-                style = current_style or styles.get("p", base_styles["Normal"])
-                elements.append(Paragraph(content, style))
-                elements.append(Spacer(1, 6))
-            return ""
 
-        elif tag_name in ["h1", "h2", "h3", "h4", "h5", "h6"]:
-            content = ""
-            for child in element.children:
-                child_result = process_element(
-                    child, styles.get(tag_name, base_styles["Normal"])
-                )
-                if child_result is not None:
-                    content += child_result
-            if content.strip():
-                elements.append(
-                    Paragraph(content, styles.get(tag_name, base_styles["Normal"]))
-                )
-                elements.append(Spacer(1, 12))
-            return ""
+# Shared ReportLab styles, built once at import instead of per generated PDF
+_STYLES = getSampleStyleSheet()
+_NORMAL_STYLE = _STYLES["Normal"]
+_BOLD_STYLE = ParagraphStyle(
+    "BoldNormal", parent=_NORMAL_STYLE, fontName="Helvetica-Bold"
+)
+_TITLE_STYLE = ParagraphStyle(
+    "CustomTitle", parent=_STYLES["Heading1"], fontSize=16, spaceAfter=30
+)
+_COURSE_PAGES_TITLE_STYLE = ParagraphStyle(
+    "CoursePagesTitle", parent=_STYLES["Heading1"], fontSize=18, spaceAfter=24
+)
+_PAGE_TITLE_STYLE = ParagraphStyle(
+    "PageTitle", parent=_STYLES["Heading2"], fontSize=14, spaceAfter=12
+)
+_TOC_TITLE_STYLE = ParagraphStyle(
+    "TOCTitle", parent=_STYLES["Heading2"], fontSize=14, spaceAfter=6
+)
+_LINK_STYLE = ParagraphStyle(
+    "PageLink",
+    parent=_NORMAL_STYLE,
+    textColor=blue,
+    underline=True,
+    spaceAfter=6,
+)
+# Default padding of the Frame SimpleDocTemplate lays pages out in (inside the inch margins)
+_FRAME_PADDING = 6
+
+# Per-stylesheet cache of the ParagraphStyles used by html_to_pdf_elements
+_HTML_STYLE_CACHE = weakref.WeakKeyDictionary()
+
+# LRU cache of parsed HTML fragments (recipes, not flowables) for html_to_pdf_elements
+_HTML_RECIPE_CACHE: "OrderedDict[tuple, tuple]" = OrderedDict()
+_HTML_RECIPE_CACHE_SIZE = 512
+_HTML_RECIPE_CACHE_MAX_CHARS = 4096
+_HTML_RECIPE_LOCK = threading.Lock()
+
+
+def _get_html_styles(base_styles):
+    """Return the HTML tag styles derived from base_styles, building them once per stylesheet."""
+    styles = _HTML_STYLE_CACHE.get(base_styles)
+    if styles is None:
+        styles = {
+            "p": base_styles["Normal"],
+            "h1": ParagraphStyle(
+                "h1", parent=base_styles["Heading1"], fontSize=18, spaceAfter=20
+            ),
+            "h2": ParagraphStyle(
+                "h2", parent=base_styles["Heading2"], fontSize=16, spaceAfter=18
+            ),
+            "h3": ParagraphStyle(
+                "h3", parent=base_styles["Heading3"], fontSize=14, spaceAfter=16
+            ),
+            "h4": ParagraphStyle(
+                "h4", parent=base_styles["Heading4"], fontSize=12, spaceAfter=14
+            ),
+            "h5": ParagraphStyle(
+                "h5",
+                parent=base_styles["Normal"],
+                fontSize=11,
+                fontName="Helvetica-Bold",
+                spaceAfter=12,
+            ),
+            "h6": ParagraphStyle(
+                "h6",
+                parent=base_styles["Normal"],
+                fontSize=10,
+                fontName="Helvetica-Bold",
+                spaceAfter=10,
+            ),
+            "strong": ParagraphStyle(
+                "strong", parent=base_styles["Normal"], fontName="Helvetica-Bold"
+            ),
+            "b": ParagraphStyle(
+                "b", parent=base_styles["Normal"], fontName="Helvetica-Bold"
+            ),
+            "em": ParagraphStyle(
+                "em", parent=base_styles["Normal"], fontName="Helvetica-Oblique"
+            ),
+            "i": ParagraphStyle(
+                "i", parent=base_styles["Normal"], fontName="Helvetica-Oblique"
+            ),
+            "u": ParagraphStyle("u", parent=base_styles["Normal"], underline=True),
+            "blockquote": ParagraphStyle(
+                "blockquote",
+                parent=base_styles["Normal"],
+                leftIndent=20,
+                rightIndent=20,
+            ),
+            "code": ParagraphStyle(
+                "code",
+                parent=base_styles["Normal"],
+                fontName="Courier",
+                fontSize=9,
+                backColor=HexColor("#f0f0f0"),
+            ),
+            "pre": ParagraphStyle(
+                "pre",
+                parent=base_styles["Normal"],
+                fontName="Courier",
+                fontSize=9,
+                leftIndent=10,
+            ),
+            "li": ParagraphStyle(
+                "li", parent=base_styles["Normal"], leftIndent=15, bulletIndent=5
+            ),
+        }
+        _HTML_STYLE_CACHE[base_styles] = styles
+    return styles
 
-        elif tag_name in ["strong", "b"]:
-            content = ""
-            for child in element.children:
-                content += process_element(
-                    child, styles.get("strong", base_styles["Normal"])
-                )
-            return content
 
-        elif tag_name in ["em", "i"]:
-            content = ""
-            for child in element.children:
-                content += process_element(
-                    child, styles.get("em", base_styles["Normal"])
-                )
-            return content
+def _html_to_plain(text):
+    """Flatten an HTML fragment to plain text, returning the input unchanged on failure."""
+    try:
+        return BeautifulSoup(text, _BS_PARSER).get_text(" ", strip=True)
+    except Exception:
+        return text
 
-        elif tag_name == "u":
-            content = ""
-            for child in element.children:
-                content += process_element(
-                    child, styles.get("u", base_styles["Normal"])
-                )
-            return content
 
-        elif tag_name == "br":
-            return "<br/>"
+def _html_to_pdf_recipe(html_content, base_styles):
+    """Convert HTML content to a tuple of flowable recipes (see _build_flowable)."""
+    try:
+        body = lxml.html.document_fromstring(html_content).body
+    except (etree.ParserError, ValueError):
+        return ()
+    if body is None:
+        return ()
 
-        elif tag_name == "a":
-            href = element.get("href", "")
-            content = ""
-            for child in element.children:
-                content += process_element(child, current_style)
-            if content.strip():
-                # Skip anchor links that cause PDF generation issues
-                if href.startswith("#"):
-                    return content
-                # Create a link style
-                link_style = ParagraphStyle(
-                    "link",
-                    parent=current_style or base_styles["Normal"],
-                    textColor=blue,
-                    underline=True,
-                )
-                return f'<link href="{href}">{content}</link>'
-            return content
-
-        elif tag_name in ["ul", "ol"]:
-            list_items = []
-            for li in element.find_all("li", recursive=False):
-                li_content = ""
-                for child in li.children:
-                    child_result = process_element(
-                        child, styles.get("li", base_styles["Normal"])
-                    )
-                    if child_result is not None:
-                        li_content += child_result
-                if li_content.strip():
-                    list_items.append(
-                        Paragraph(li_content, styles.get("li", base_styles["Normal"]))
-                    )
+    elements = []
+    styles = _get_html_styles(base_styles)
 
-            if list_items:
-                if tag_name == "ul":
-                    elements.append(
-                        ListFlowable(list_items, bulletType="bullet", start="•")
-                    )
-                else:  # ol
-                    elements.append(ListFlowable(list_items, bulletType="1"))
-                elements.append(Spacer(1, 6))
+    def styled_text(text, style):
+        """Escape a text run and wrap it in the font of the current style."""
+        if not text or not text.strip():
             return ""
+        # Escape HTML entities to prevent parsing errors
+        text = text.translate(_HTML_ESCAPE)
+        if style:
+            return (
+                f'<font name="{style.fontName}" size="{style.fontSize}">{text}</font>'
+            )
+        return text
+
+    def flush_inline(parts, spacer=True):
+        """Wrap accumulated top-level inline content into a paragraph."""
+        content = "".join(parts)
+        parts.clear()
+        if content.strip():
+            elements.append(("para", content, base_styles["Normal"]))
+            if spacer:
+                elements.append(("spacer", 6))
+
+    # Each frame is (tag, kind, style, parts, list_items). ``parts`` collects
+    # inline markup for the nearest enclosing block (None discards text, e.g.
+    # inside <ul>), and ``list_items`` collects Paragraphs for <ul>/<ol>.
+    inline_parts = []  # Top-level inline content waiting to be wrapped
+    stack = [(None, None, None, inline_parts, None)]
+    inline_parts.append(styled_text(body.text, None))
+
+    walker = etree.iterwalk(body, events=("start", "end", "comment", "pi"))
+    for event, element in walker:
+        if element is body:
+            continue
 
-        elif tag_name == "li":
-            # This should be handled by ul/ol processing above
-            content = ""
-            for child in element.children:
-                content += process_element(child, current_style)
-            return content
-
-        elif tag_name == "blockquote":
-            content = ""
-            for child in element.children:
-                child_result = process_element(
-                    child, styles.get("blockquote", base_styles["Normal"])
-                )
-                if child_result is not None:
-                    content += child_result
-            if content.strip():
-                elements.append(
-                    Paragraph(content, styles.get("blockquote", base_styles["Normal"]))
-                )
-                elements.append(Spacer(1, 6))
-            return ""
+        if event == "comment" or event == "pi":
+            # Drop the node itself but keep the text that follows it
+            parts = stack[-1][3]
+            if parts is not None:
+                parts.append(styled_text(element.tail, stack[-1][2]))
+            continue
 
-        elif tag_name in ["code", "pre"]:
-            content = element.get_text()
-            if content.strip():
-                elements.append(
-                    Paragraph(content, styles.get(tag_name, base_styles["Normal"]))
-                )
-                elements.append(Spacer(1, 6))
-            return ""
+        tag = element.tag
+        if event == "start":
+            _, parent_kind, current_style, parts, list_items = stack[-1]
+            kind = _TAG_KINDS.get(tag)
 
-        else:
-            # For unknown tags, process children
-            content = ""
-            for child in element.children:
-                child_result = process_element(child, current_style)
-                if child_result is not None:
-                    content += child_result
-            return content
-
-    # Process all top-level elements
-    def is_block_tag(name: str) -> bool:
-        if not name:
-            return False
-        name = name.lower()
-        return name in {
-            "p",
-            "div",
-            "h1",
-            "h2",
-            "h3",
-            "h4",
-            "h5",
-            "h6",
-            "ul",
-            "ol",
-            "li",
-            "blockquote",
-            "pre",
-            "code",
-        }
+            # Lists only render their <li> children
+            if parent_kind == "list":
+                if kind == "item":
+                    stack.append((tag, kind, styles["li"], [], list_items))
+                    stack[-1][3].append(styled_text(element.text, styles["li"]))
+                else:
+                    walker.skip_subtree()
+                    stack.append((tag, kind, current_style, None, None))
+                continue
 
-    for element in soup.children:
-        # If we encounter a block-level element, flush any accumulated inline content first
-        if isinstance(element, Tag) and is_block_tag(element.name):
-            if inline_buffer.strip():
-                elements.append(Paragraph(inline_buffer, base_styles["Normal"]))
-                elements.append(Spacer(1, 6))
-                inline_buffer = ""
-            process_element(element)
+            # A top-level block element closes any pending inline paragraph
+            if kind in _BLOCK_KINDS and element.getparent() is body:
+                flush_inline(inline_parts)
+
+            if kind == "paragraph" or kind == "link":
+                frame = (tag, kind, current_style, [], None)
+            elif kind == "heading" or kind == "blockquote":
+                frame = (tag, kind, styles[tag], [], None)
+            elif kind == "inline":
+                frame = (tag, kind, styles[_INLINE_STYLE_TAGS[tag]], parts, None)
+            elif kind == "list":
+                frame = (tag, kind, current_style, None, [])
+            elif kind == "preformatted":
+                content = element.text_content()
+                if content.strip():
+                    elements.append(
+                        ("para", content.translate(_HTML_ESCAPE), styles[tag])
+                    )
+                    elements.append(("spacer", 6))
+                walker.skip_subtree()
+                frame = (tag, kind, current_style, None, None)
+            else:
+                if kind == "break" and parts is not None:
+                    parts.append("<br/>")
+                # Unknown tags (and stray <li>) pass their content through
+                frame = (tag, kind, current_style, parts, None)
+
+            stack.append(frame)
+            if frame[3] is not None:
+                frame[3].append(styled_text(element.text, frame[2]))
             continue
 
-        # Otherwise, collect inline content and wrap later as a paragraph
-        if isinstance(element, (Tag, NavigableString)):
-            returned_text = process_element(element)
-            if isinstance(returned_text, str) and returned_text.strip():
-                inline_buffer += returned_text
+        # End event: emit flowables for the element being closed
+        tag, kind, style, parts, list_items = stack.pop()
+        parent_parts = stack[-1][3]
+
+        if kind == "paragraph":
+            content = "".join(parts)
+            if content.strip():
+                elements.append(("para", content, style or styles["p"]))
+                elements.append(("spacer", 6))
+        elif kind == "heading" or kind == "blockquote":
+            content = "".join(parts)
+            if content.strip():
+                elements.append(("para", content, style))
+                elements.append(("spacer", 12 if kind == "heading" else 6))
+        elif kind == "link":
+            content = "".join(parts)
+            href = element.get("href", "")
+            # Skip anchor links that cause PDF generation issues
+            if content.strip() and not href.startswith("#"):
+                content = f'<link href="{html.escape(href)}">{content}</link>'
+            if parent_parts is not None:
+                parent_parts.append(content)
+        elif kind == "item" and list_items is not None:
+            content = "".join(parts)
+            if content.strip():
+                list_items.append((content, style))
+        elif kind == "list" and list_items:
+            elements.append(("list", tuple(list_items), tag))
+            elements.append(("spacer", 6))
+
+        # Trailing text belongs to the enclosing element
+        parent_style, parent_parts = stack[-1][2], stack[-1][3]
+        if parent_parts is not None:
+            parent_parts.append(styled_text(element.tail, parent_style))
 
     # Flush any remaining inline content as a final paragraph
-    if inline_buffer.strip():
-        elements.append(Paragraph(inline_buffer, base_styles["Normal"]))
+    flush_inline(inline_parts, spacer=False)
+
+    return tuple(elements)
 
-    return elements
+
+def _build_flowable(recipe):
+    """Instantiate one flowable from a recipe produced by _html_to_pdf_recipe."""
+    kind = recipe[0]
+    if kind == "para":
+        return Paragraph(recipe[1], recipe[2])
+    if kind == "spacer":
+        return Spacer(1, recipe[1])
+    items = [Paragraph(text, style) for text, style in recipe[1]]
+    if recipe[2] == "ul":
+        return ListFlowable(items, bulletType="bullet", start="•")
+    return ListFlowable(items, bulletType="1")
+
+
+def html_to_pdf_elements(html_content, base_styles):
+    """Convert HTML content to ReportLab flowables with formatting preserved.
+
+    Short fragments (e.g. rubric rating descriptions, which repeat across
+    criteria) are parsed once; their recipes are kept in a small LRU cache and
+    fresh flowables are built on every call, since flowables hold layout state.
+    """
+    if not html_content or not html_content.strip():
+        return []
+
+    cacheable = len(html_content) <= _HTML_RECIPE_CACHE_MAX_CHARS
+    key = (html_content, base_styles)
+    recipe = None
+    if cacheable:
+        with _HTML_RECIPE_LOCK:
+            recipe = _HTML_RECIPE_CACHE.get(key)
+            if recipe is not None:
+                _HTML_RECIPE_CACHE.move_to_end(key)
+    if recipe is None:
+        recipe = _html_to_pdf_recipe(html_content, base_styles)
+        if cacheable:
+            with _HTML_RECIPE_LOCK:
+                _HTML_RECIPE_CACHE[key] = recipe
+                if len(_HTML_RECIPE_CACHE) > _HTML_RECIPE_CACHE_SIZE:
+                    _HTML_RECIPE_CACHE.popitem(last=False)
+    return [_build_flowable(entry) for entry in recipe]
 
 
 def display_courses_and_get_selection(courses, last_course_ids=None):
     """Displays available courses and gets user selection."""
-    print("\nAvailable courses:")
+    last_set = last_course_ids or frozenset()
+    lines = ["\nAvailable courses:"]
     for i, course in enumerate(courses, 1):
-        course_name = course.get("name", "Unnamed")
-        course_code = course.get("course_code", "")
-        marker = (
-            " (last selected)"
-            if last_course_ids and str(course.get("id")) in last_course_ids
-            else ""
+        marker = " (last selected)" if str(course.get("id")) in last_set else ""
+        lines.append(
+            f"{i}. {course.get('name', 'Unnamed')} ({course.get('course_code', '')}){marker}"
         )
-        print(f"{i}. {course_name} ({course_code}){marker}")
+    print("\n".join(lines))
 
     print("\nOptions:")
     print("- Enter course numbers separated by commas (e.g., 1,3,5)")
@@ -460,9 +916,7 @@ def display_courses_and_get_selection(courses, last_course_ids=None):
                 # Find courses that match the last selected IDs
 
                 last_courses = [
-                    course
-                    for course in courses
-                    if str(course.get("id")) in last_course_ids
+                    course for course in courses if str(course.get("id")) in last_set
                 ]
                 if last_courses:
                     print(f"Using last selection: {len(last_courses)} course(s)")
@@ -503,13 +957,21 @@ def display_courses_and_get_selection(courses, last_course_ids=None):
             return []
 
 
+def _get_config() -> configparser.ConfigParser:
+    """Returns the parsed config file, reading it from disk only once per run."""
+    global _config
+    if _config is None:
+        _config = configparser.ConfigParser()
+        _config.read(CONFIG_FILE)
+    return _config
+
+
 def save_last_selection(selected_courses):
     """Saves the selected course IDs to config file."""
     if not selected_courses:
         return
 
-    config = configparser.ConfigParser()
-    config.read(CONFIG_FILE)
+    config = _get_config()
 
     if not config.has_section("LAST_SELECTION"):
         config.add_section("LAST_SELECTION")
@@ -517,26 +979,26 @@ def save_last_selection(selected_courses):
     course_ids = [
         str(course.get("id")) for course in selected_courses if course.get("id")
     ]
+    # Re-syncing the same courses is the common case; leave config.ini untouched
+    if set(course_ids) == load_last_selection():
+        return
     config.set("LAST_SELECTION", "COURSE_IDS", ",".join(course_ids))
 
-    with open(CONFIG_FILE, "w") as configfile:
+    # Write to a temp file and swap it in so an interrupted run can't truncate the config
+    tmp_path = f"{CONFIG_FILE}.tmp"
+    with open(tmp_path, "w") as configfile:
         config.write(configfile)
+    os.replace(tmp_path, CONFIG_FILE)
 
 
 def load_last_selection():
     """Loads the last selected course IDs from config file."""
-    if not os.path.exists(CONFIG_FILE):
-        return None
-
-    config = configparser.ConfigParser()
-    config.read(CONFIG_FILE)
+    # A missing config file parses as empty, so no existence check is needed
+    config = _get_config()
 
-    if config.has_section("LAST_SELECTION") and config.has_option(
-        "LAST_SELECTION", "COURSE_IDS"
-    ):
-        course_ids_str = config.get("LAST_SELECTION", "COURSE_IDS").strip()
-        if course_ids_str:
-            return set(course_ids_str.split(","))
+    course_ids_str = config.get("LAST_SELECTION", "COURSE_IDS", fallback="").strip()
+    if course_ids_str:
+        return set(course_ids_str.split(","))
 
     return None
 
@@ -555,27 +1017,14 @@ def get_canvas_quizzes(
     """
     url = f"{api_url}/api/v1/courses/{course_id}/quizzes"
     headers = {"Authorization": f"Bearer {api_key}"}
-    quizzes = []
-    params = {"per_page": per_page}
     try:
-        while url:
-            response = session.get(url, headers=headers, params=params, timeout=timeout)
-            response.raise_for_status()
-            data = response.json()
-            quizzes.extend(data)
-            # Handle pagination
-            link = response.headers.get("Link", "")
-            next_url = None
-            for part in link.split(","):
-                if 'rel="next"' in part:
-                    next_url = part[part.find("<") + 1 : part.find(">")]
-                    break
-            url = next_url
-            params = {}  # Only use params on first request
+        # Same parallel rel="last" pagination as the other course listings
+        return get_paginated_canvas_items(
+            url, headers, session, timeout, per_page, raise_errors=True
+        )
     except requests.RequestException as e:
-        print(f"Error fetching quizzes for course {course_id}: {e}")
+        logger.error(f"Error fetching quizzes for course {course_id}: {e}")
         return []
-    return quizzes
 
 
 # --- Google Drive Service Functions ---
@@ -583,6 +1032,7 @@ def get_canvas_quizzes(
 
 def get_drive_service():
     """Authenticates with the Google Drive API and returns a service object."""
+    global _drive_credentials
     creds = None
     if os.path.exists(GOOGLE_TOKEN_FILE):
         creds = Credentials.from_authorized_user_file(GOOGLE_TOKEN_FILE, SCOPES)
@@ -591,12 +1041,12 @@ def get_drive_service():
             try:
                 creds.refresh(Request())
             except Exception as e:
-                print(f"Could not refresh token: {e}. Re-authenticating...")
+                logger.warning(f"Could not refresh token: {e}. Re-authenticating...")
                 os.remove(GOOGLE_TOKEN_FILE)
                 return get_drive_service()
         else:
             if not os.path.exists(GOOGLE_CREDS_FILE):
-                print(
+                logger.error(
                     f"ERROR: Google credentials file '{GOOGLE_CREDS_FILE}' not found."
                 )
                 return None
@@ -604,55 +1054,264 @@ def get_drive_service():
             creds = flow.run_local_server(port=0)
         with open(GOOGLE_TOKEN_FILE, "w") as token:
             token.write(creds.to_json())
+    _drive_credentials = creds
     try:
         return build("drive", "v3", credentials=creds)
     except HttpError as error:
-        print(f"An error occurred building Drive service: {error}")
+        logger.error(f"An error occurred building Drive service: {error}")
         return None
 
 
-def get_or_create_folder(service, folder_name, parent_id=None):
-    """Finds a folder by name. If not found, creates it. Returns the folder ID."""
+def drive_list_all(service, q, fields, **kwargs):
+    """Runs a Drive files().list query and follows nextPageToken to collect every match."""
+    if not fields.startswith("nextPageToken"):
+        fields = f"nextPageToken, {fields}"
+    files, page_token = [], None
+    while True:
+        response = (
+            service.files()
+            .list(
+                q=q,
+                fields=fields,
+                pageSize=DRIVE_LIST_PAGE_SIZE,
+                pageToken=page_token,
+                **kwargs,
+            )
+            .execute(num_retries=DRIVE_NUM_RETRIES)
+        )
+        files.extend(response.get("files", []))
+        page_token = response.get("nextPageToken")
+        if not page_token:
+            return files
+
+
+def _get_thread_drive_service(service):
+    """Returns a Drive service that is safe to use from the current thread.
+
+    The httplib2 transport behind a Drive service is not thread-safe, so worker
+    threads get their own service built from the credentials get_drive_service
+    stored in _drive_credentials.
+    """
+    if (
+        service is None
+        or _drive_credentials is None
+        or threading.current_thread() is threading.main_thread()
+    ):
+        return service
+    thread_service = getattr(_THREAD_LOCAL, "drive_service", None)
+    if thread_service is None:
+        thread_service = build("drive", "v3", credentials=_drive_credentials)
+        _THREAD_LOCAL.drive_service = thread_service
+    return thread_service
+
+
+def _drive_folder_query(folder_name, parent_id=None):
+    """Builds the files().list query that finds a folder by name under a parent."""
     # Escape single quotes in folder_name for query
     escaped_name = folder_name.replace("'", "\\'")
-    query = f"name='{escaped_name}' and mimeType='application/vnd.google-apps.folder'"
+    query = f"name='{escaped_name}' and mimeType='{DRIVE_FOLDER_MIME_TYPE}'"
     query += f" and '{parent_id}' in parents" if parent_id else " and 'root' in parents"
+    return query
+
+
+def _drive_folder_metadata(folder_name, parent_id=None):
+    """Builds the files().create body for a new folder."""
+    file_metadata = {"name": folder_name, "mimeType": DRIVE_FOLDER_MIME_TYPE}
+    if parent_id:
+        file_metadata["parents"] = [parent_id]
+    return file_metadata
+
+
+def _drive_folder_lock(spec):
+    """Returns the lock serializing lookup-and-create for one (parent_id, name)."""
+    with _DRIVE_FOLDER_LOCKS_LOCK:
+        lock = _drive_folder_locks.get(spec)
+        if lock is None:
+            lock = _drive_folder_locks[spec] = threading.Lock()
+        return lock
+
+
+def get_or_create_folder(service, folder_name, parent_id=None):
+    """Finds a folder by name. If not found, creates it. Returns the folder ID."""
+    spec = (parent_id, folder_name)
+    cached_id = _drive_folder_ids.get(spec)
+    if cached_id:
+        return cached_id
+    with _drive_folder_lock(spec):
+        # Another worker may have resolved it while we waited
+        cached_id = _drive_folder_ids.get(spec)
+        if cached_id:
+            return cached_id
+        return _find_or_create_folder(service, folder_name, parent_id)
+
+
+def _find_or_create_folder(service, folder_name, parent_id=None):
+    """Looks a folder up and creates it if missing; caller holds its folder lock."""
+    query = _drive_folder_query(folder_name, parent_id)
     try:
-        response = (
-            service.files().list(q=query, spaces="drive", fields="files(id)").execute()
-        )
-        folders = response.get("files", [])
+        folders = drive_list_all(service, query, "files(id)", spaces="drive")
         if folders:
-            return folders[0].get("id")
+            folder_id = folders[0].get("id")
         else:
-            print(f"Creating Google Drive folder: '{folder_name}'...")
-            file_metadata = {
-                "name": folder_name,
-                "mimeType": "application/vnd.google-apps.folder",
-            }
-            if parent_id:
-                file_metadata["parents"] = [parent_id]
-            folder = service.files().create(body=file_metadata, fields="id").execute()
-            return folder.get("id")
+            logger.info(f"Creating Google Drive folder: '{folder_name}'...")
+            file_metadata = _drive_folder_metadata(folder_name, parent_id)
+            folder = (
+                service.files()
+                .create(body=file_metadata, fields="id")
+                .execute(num_retries=DRIVE_NUM_RETRIES)
+            )
+            folder_id = folder.get("id")
+        if folder_id:
+            _drive_folder_ids[(parent_id, folder_name)] = folder_id
+        return folder_id
     except HttpError as error:
-        print(f"Error finding/creating folder '{folder_name}': {error}")
+        logger.error(f"Error finding/creating folder '{folder_name}': {error}")
         return None
 
 
+def _execute_drive_batch(service, requests_by_key):
+    """Executes {key: request} through Drive batch calls and returns {key: (response, error)}."""
+    results = {}
+    keys = list(requests_by_key)
+    for start in range(0, len(keys), DRIVE_BATCH_SIZE):
+        chunk = keys[start : start + DRIVE_BATCH_SIZE]
+
+        def callback(request_id, response, exception):
+            results[chunk[int(request_id)]] = (response, exception)
+
+        batch = service.new_batch_http_request(callback=callback)
+        for i, key in enumerate(chunk):
+            batch.add(requests_by_key[key], request_id=str(i))
+        try:
+            batch.execute()
+        except HttpError as error:
+            for key in chunk:
+                results.setdefault(key, (None, error))
+    return results
+
+
+def ensure_folders(service, folder_specs):
+    """Finds or creates many Drive folders with batched metadata calls.
+
+    folder_specs is an iterable of (parent_id, name). All lookups go out in one
+    batch and all missing folders are created in a second one, instead of one or
+    two round-trips per folder. Folders already resolved in this run are served
+    from _drive_folder_ids. Returns {(parent_id, name): folder_id}; folders that
+    could not be resolved map to None.
+    """
+    specs = list(dict.fromkeys(folder_specs))
+    folder_ids = {
+        spec: _drive_folder_ids[spec] for spec in specs if spec in _drive_folder_ids
+    }
+    specs = [spec for spec in specs if spec not in folder_ids]
+    if not specs:
+        return folder_ids
+
+    with ExitStack() as stack:
+        # Lock in a fixed order so two callers with overlapping specs cannot deadlock
+        for spec in sorted(specs, key=lambda spec: (spec[0] or "", spec[1])):
+            stack.enter_context(_drive_folder_lock(spec))
+        for spec in specs:
+            if spec in _drive_folder_ids:
+                folder_ids[spec] = _drive_folder_ids[spec]
+        specs = [spec for spec in specs if spec not in folder_ids]
+        if specs:
+            _ensure_missing_folders(service, specs, folder_ids)
+    return folder_ids
+
+
+def _ensure_missing_folders(service, specs, folder_ids):
+    """Batch lookup-and-create for ensure_folders; caller holds the folder locks."""
+    lookups = _execute_drive_batch(
+        service,
+        {
+            (parent_id, name): service.files().list(
+                q=_drive_folder_query(name, parent_id),
+                spaces="drive",
+                fields="files(id)",
+                pageSize=1,
+            )
+            for parent_id, name in specs
+        },
+    )
+    missing = []
+    for spec in specs:
+        response, error = lookups.get(spec, (None, None))
+        if error is not None or response is None:
+            # Fall back to the one-at-a-time path for lookups the batch could not answer
+            folder_ids[spec] = _find_or_create_folder(
+                service, spec[1], parent_id=spec[0]
+            )
+            continue
+        folders = response.get("files", [])
+        if folders:
+            folder_ids[spec] = _drive_folder_ids[spec] = folders[0].get("id")
+        else:
+            missing.append(spec)
+
+    if missing:
+        for _, name in missing:
+            logger.info(f"Creating Google Drive folder: '{name}'...")
+        created = _execute_drive_batch(
+            service,
+            {
+                (parent_id, name): service.files().create(
+                    body=_drive_folder_metadata(name, parent_id), fields="id"
+                )
+                for parent_id, name in missing
+            },
+        )
+        for spec in missing:
+            response, error = created.get(spec, (None, None))
+            if error is not None or response is None:
+                logger.error(f"Error finding/creating folder '{spec[1]}': {error}")
+                folder_ids[spec] = None
+            else:
+                folder_ids[spec] = _drive_folder_ids[spec] = response.get("id")
+
+
 def get_existing_files_in_drive_folder(service, folder_id):
     """Returns a set of filenames that already exist in a Drive folder."""
     if not folder_id:
         return set()
+    index = _get_drive_folder_index(service, folder_id)
+    with _DRIVE_INDEX_LOCK:
+        return set(index.keys())
+
+
+def _drive_upload_media(
+    service, media, drive_filename, folder_id, existing_file_id=None
+):
+    """Creates or updates a Drive file from a prepared media upload and records it in the folder index."""
     try:
-        response = (
-            service.files()
-            .list(q=f"'{folder_id}' in parents", spaces="drive", fields="files(name)")
-            .execute()
-        )
-        return {item["name"] for item in response.get("files", [])}
+        if existing_file_id:
+            logger.info(f"Updating '{drive_filename}' in Google Drive...")
+            file = (
+                service.files()
+                .update(
+                    fileId=existing_file_id,
+                    media_body=media,
+                    fields="id, size, modifiedTime",
+                )
+                .execute(num_retries=DRIVE_NUM_RETRIES)
+            )
+        else:
+            logger.info(f"Uploading '{drive_filename}' to Google Drive...")
+            file_metadata = {"name": drive_filename, "parents": [folder_id]}
+            file = (
+                service.files()
+                .create(
+                    body=file_metadata,
+                    media_body=media,
+                    fields="id, size, modifiedTime",
+                )
+                .execute(num_retries=DRIVE_NUM_RETRIES)
+            )
+        _record_drive_file(folder_id, drive_filename, file)
+        return True
     except HttpError as error:
-        print(f"Error fetching files from Drive folder: {error}")
-        return set()
+        logger.error(f"An error occurred during file upload/update: {error}")
+        return False
 
 
 def upload_file_to_drive(
@@ -664,76 +1323,173 @@ def upload_file_to_drive(
     drive_chunk_size_mb: int = DEFAULT_DRIVE_CHUNK_SIZE_MB,
 ):
     """Uploads a single file to the specified Google Drive folder, or updates if existing_file_id provided."""
-    if not os.path.exists(local_path):
-        return False
     try:
-        chunk_bytes = max(256 * 1024, drive_chunk_size_mb * 1024 * 1024)
-        if existing_file_id:
-            print(f"Updating '{drive_filename}' in Google Drive...")
-            media = MediaFileUpload(local_path, chunksize=chunk_bytes, resumable=True)
-            service.files().update(fileId=existing_file_id, media_body=media).execute()
-        else:
-            print(f"Uploading '{drive_filename}' to Google Drive...")
-            file_metadata = {"name": drive_filename, "parents": [folder_id]}
-            # Specify mimetype for HTML files for better browser handling
-            mimetype = "text/html" if drive_filename.lower().endswith(".html") else None
-            media = MediaFileUpload(
-                local_path, mimetype=mimetype, chunksize=chunk_bytes, resumable=True
-            )
-            service.files().create(
-                body=file_metadata, media_body=media, fields="id"
-            ).execute()
-        return True
-    except HttpError as error:
-        print(f"An error occurred during file upload/update: {error}")
+        file_size = os.stat(local_path).st_size
+    except FileNotFoundError:
         return False
+    chunk_bytes = max(256 * 1024, drive_chunk_size_mb * 1024 * 1024)
+    # Small files skip the extra round-trip that opens a resumable session
+    resumable = file_size >= DRIVE_SIMPLE_UPLOAD_MAX_BYTES
+    if existing_file_id:
+        media = MediaFileUpload(local_path, chunksize=chunk_bytes, resumable=resumable)
+    else:
+        # Specify mimetype for HTML files for better browser handling
+        mimetype = "text/html" if drive_filename.lower().endswith(".html") else None
+        media = MediaFileUpload(
+            local_path, mimetype=mimetype, chunksize=chunk_bytes, resumable=resumable
+        )
+    return _drive_upload_media(
+        service, media, drive_filename, folder_id, existing_file_id
+    )
+
+
+def upload_stream_to_drive(
+    service,
+    stream,
+    drive_filename,
+    folder_id,
+    existing_file_id=None,
+    drive_chunk_size_mb: int = DEFAULT_DRIVE_CHUNK_SIZE_MB,
+):
+    """Uploads a file-like object (e.g. an in-memory download) to Drive without touching disk."""
+    chunk_bytes = max(256 * 1024, drive_chunk_size_mb * 1024 * 1024)
+    mimetype = mimetypes.guess_type(drive_filename)[0] or "application/octet-stream"
+    position = stream.tell()
+    stream_size = stream.seek(0, io.SEEK_END) - position
+    stream.seek(position)
+    media = MediaIoBaseUpload(
+        stream,
+        mimetype=mimetype,
+        chunksize=chunk_bytes,
+        resumable=stream_size >= DRIVE_SIMPLE_UPLOAD_MAX_BYTES,
+    )
+    return _drive_upload_media(
+        service, media, drive_filename, folder_id, existing_file_id
+    )
 
 
 # --- Local Storage Functions ---
 
 
+def _remove_download_dir(path):
+    """Deletes the temp download folder, discarding leftovers from a crashed run."""
+    shutil.rmtree(path, ignore_errors=True)
+
+
 def get_or_create_local_folder(local_root_dir, folder_name, parent_path=None):
     """Creates a local folder if it doesn't exist. Returns the full path."""
     if parent_path:
         folder_path = os.path.join(parent_path, folder_name)
     else:
         folder_path = os.path.join(local_root_dir, folder_name)
+    if folder_path in _local_folder_paths:
+        return folder_path
 
-    if not os.path.exists(folder_path):
+    try:
         os.makedirs(folder_path)
-        print(f"Created local folder: '{folder_path}'")
+        logger.info(f"Created local folder: '{folder_path}'")
+    except FileExistsError:
+        pass
+    _local_folder_paths.add(folder_path)
     return folder_path
 
 
 def get_existing_files_in_local_folder(folder_path):
     """Returns a set of filenames that already exist in a local folder."""
-    if not os.path.exists(folder_path):
-        return set()
     try:
-        return {
-            f
-            for f in os.listdir(folder_path)
-            if os.path.isfile(os.path.join(folder_path, f))
-        }
+        # scandir's DirEntry caches the file type, avoiding a stat per entry
+        with os.scandir(folder_path) as entries:
+            return {entry.name for entry in entries if entry.is_file()}
+    except FileNotFoundError:
+        return set()
     except OSError as error:
-        print(f"Error reading local folder '{folder_path}': {error}")
+        logger.error(f"Error reading local folder '{folder_path}': {error}")
         return set()
 
 
 def save_file_locally(local_path, filename, folder_path):
     """Moves a file from temp directory to the specified local folder."""
-    if not os.path.exists(local_path):
+    try:
+        source_device = os.stat(local_path).st_dev
+    except FileNotFoundError:
         return False
     try:
         destination_path = os.path.join(folder_path, filename)
-        shutil.move(local_path, destination_path)
-        print(f"Saved '{filename}' to local storage: '{folder_path}'")
+        if source_device == os.stat(folder_path).st_dev:
+            # Same filesystem: a single atomic rename that also replaces an older copy
+            os.replace(local_path, destination_path)
+        else:
+            shutil.move(local_path, destination_path)
+        logger.info(f"Saved '{filename}' to local storage: '{folder_path}'")
+        return True
+    except OSError as error:
+        logger.error(f"An error occurred saving file locally: {error}")
+        return False
+
+
+def save_buffer_locally(buffer, filename, folder_path):
+    """Writes an in-memory file into a local folder, replacing any older copy atomically."""
+    destination_path = os.path.join(folder_path, filename)
+    tmp_path = f"{destination_path}.part"
+    try:
+        with open(tmp_path, "wb") as f:
+            shutil.copyfileobj(buffer, f)
+        os.replace(tmp_path, destination_path)
+        logger.info(f"Saved '{filename}' to local storage: '{folder_path}'")
         return True
     except OSError as error:
-        print(f"An error occurred saving file locally: {error}")
+        logger.error(f"An error occurred saving file locally: {error}")
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
         return False
 
 
+def store_buffer(
+    buffer,
+    filename,
+    storage_type,
+    folder_path_or_id,
+    drive_service=None,
+    existing_file_id=None,
+    drive_chunk_size_mb: int = DEFAULT_DRIVE_CHUNK_SIZE_MB,
+):
+    """Saves an in-memory file (e.g. a generated PDF) to Drive or to a local folder."""
+    buffer.seek(0)
+    if storage_type == "google_drive":
+        return upload_stream_to_drive(
+            drive_service,
+            buffer,
+            filename,
+            folder_path_or_id,
+            existing_file_id,
+            drive_chunk_size_mb=drive_chunk_size_mb,
+        )
+    return save_buffer_locally(buffer, filename, folder_path_or_id)
+
+
+def _canvas_page_urls_from_last(first_url, last_url):
+    """Builds the URLs for pages 2..last from Canvas' rel="last" link.
+
+    Returns None when the last link does not carry a numeric page number
+    (e.g. bookmark-style pagination), in which case callers must follow
+    rel="next" links one at a time.
+    """
+    parsed = urlparse(last_url)
+    query = parse_qs(parsed.query, keep_blank_values=True)
+    try:
+        last_page = int(query.get("page", [""])[0])
+        first_page = int(parse_qs(urlparse(first_url).query).get("page", ["1"])[0])
+    except ValueError:
+        return None
+    urls = []
+    for page in range(first_page + 1, last_page + 1):
+        query["page"] = [str(page)]
+        urls.append(parsed._replace(query=urlencode(query, doseq=True)).geturl())
+    return urls
+
+
 def get_paginated_canvas_items(
     url,
     headers,
@@ -741,50 +1497,188 @@ def get_paginated_canvas_items(
     timeout: int,
     per_page: int,
     suppress_errors: bool = False,
+    max_workers: int = DEFAULT_PAGINATION_WORKERS,
+    raise_errors: bool = False,
 ):
-    """Handles Canvas API pagination to retrieve all items from an endpoint using a shared session, with per_page sizing."""
-    if session is None:
-        session = requests.Session()
+    """Handles Canvas API pagination to retrieve all items from an endpoint using a shared session, with per_page sizing.
+
+    When the first response advertises a rel="last" page, the remaining pages are
+    fetched concurrently and concatenated in page order; otherwise rel="next"
+    links are followed sequentially. Request errors end the listing with the
+    items fetched so far, or propagate when raise_errors is set.
+    """
+    session = session or get_shared_session()
     # Append per_page if not already present
     if "per_page=" not in url:
         url += ("&" if "?" in url else "?") + f"per_page={per_page}"
+
+    def fetch_page(page_url):
+        response = session.get(page_url, headers=headers, timeout=timeout)
+        response.raise_for_status()
+        return response
+
     items, next_url = [], url
     while next_url:
         try:
-            response = session.get(next_url, headers=headers, timeout=timeout)
-            response.raise_for_status()
+            response = fetch_page(next_url)
             items.extend(response.json())
             next_url = None
             if "Link" in response.headers:
-                links = requests.utils.parse_header_links(response.headers["Link"])
-                next_url = next(
-                    (link["url"] for link in links if link.get("rel") == "next"), None
+                links = {
+                    link.get("rel"): link["url"]
+                    for link in requests.utils.parse_header_links(
+                        response.headers["Link"]
+                    )
+                }
+                next_url = links.get("next")
+                page_urls = (
+                    _canvas_page_urls_from_last(response.url, links["last"])
+                    if next_url and "last" in links and max_workers > 1
+                    else None
                 )
+                if page_urls:
+                    with ThreadPoolExecutor(
+                        max_workers=min(max_workers, len(page_urls))
+                    ) as executor:
+                        # map() yields in submission order, preserving page order
+                        for page_response in executor.map(
+                            _in_log_course(fetch_page), page_urls
+                        ):
+                            items.extend(page_response.json())
+                    next_url = None
         except requests.exceptions.RequestException as e:
+            if raise_errors:
+                raise
             if not suppress_errors:
-                print(f"Error fetching data from Canvas: {e}")
+                logger.error(f"Error fetching data from Canvas: {e}")
             break
     return items
 
 
+# Per-course listings warmed in the background right after course selection:
+# endpoint -> (path under /api/v1/courses/<id>/, suppress_errors)
+_PREFETCH_ENDPOINTS = {
+    "assignments": ("assignments?include[]=rubric", False),
+    "modules": ("modules", False),
+    "pages": ("pages?include[]=body", True),
+}
+
+
+def prefetch_course_listings(
+    executor,
+    courses,
+    canvas_api_url,
+    headers,
+    session: Optional[requests.Session],
+    timeout: int,
+    per_page: int,
+):
+    """Starts fetching each course's assignment, module and page listings on an executor.
+
+    Returns {course_id: {endpoint: Future}} so later courses' listings download
+    while earlier courses are being synced. Read results with take_prefetched().
+    """
+    base_url = (canvas_api_url or "").rstrip("/")
+    prefetched = {}
+    for course in courses:
+        course_id = course.get("id")
+        prefetched[course_id] = {
+            endpoint: executor.submit(
+                get_paginated_canvas_items,
+                f"{base_url}/api/v1/courses/{course_id}/{path}",
+                headers,
+                session,
+                timeout,
+                per_page,
+                suppress_errors=suppress_errors,
+            )
+            for endpoint, (path, suppress_errors) in _PREFETCH_ENDPOINTS.items()
+        }
+    return prefetched
+
+
+def take_prefetched(prefetched, course_id, endpoint):
+    """Returns a prefetched listing, or None if it was never started or failed."""
+    future = prefetched.get(course_id, {}).get(endpoint)
+    if future is None:
+        return None
+    try:
+        return future.result()
+    except Exception as e:
+        logger.warning(f"Prefetch of {endpoint} failed, fetching again: {e}")
+        return None
+
+
+def canvas_file_content_unchanged(
+    file_url,
+    existing_metadata,
+    headers,
+    session: Optional[requests.Session],
+    timeout: int,
+):
+    """Checks with a HEAD request whether a stored copy still matches the Canvas file.
+
+    Canvas bumps updated_at for metadata-only edits (renames, moves, locks). When
+    the download's Content-Length equals the stored size and its Last-Modified is
+    not newer than the stored copy, the content is the same and the download can
+    be skipped. Any failure or missing header returns False.
+    """
+    session = session or get_shared_session()
+    try:
+        response = session.head(
+            file_url, headers=headers, timeout=timeout, allow_redirects=True
+        )
+        response.raise_for_status()
+        content_length = int(response.headers["Content-Length"])
+        last_modified = parsedate_to_datetime(response.headers["Last-Modified"])
+    except (requests.exceptions.RequestException, KeyError, TypeError, ValueError):
+        return False
+    if last_modified.tzinfo is None:
+        last_modified = last_modified.replace(tzinfo=timezone.utc)
+    stored_time = _to_utc_datetime(existing_metadata.get("modified_time"))
+    return (
+        content_length == existing_metadata.get("size")
+        and stored_time is not None
+        and last_modified <= stored_time
+    )
+
+
 def download_canvas_file(
     file_url, local_path, headers, session: Optional[requests.Session], timeout: int
 ):
     """Downloads a file from a Canvas URL to a local path."""
-    if session is None:
-        session = requests.Session()
+    session = session or get_shared_session()
     try:
         with session.get(file_url, headers=headers, stream=True, timeout=timeout) as r:
             r.raise_for_status()
+            # Let urllib3 undo any gzip/deflate transfer encoding and copy in C-sized chunks
+            r.raw.decode_content = True
             with open(local_path, "wb") as f:
-                for chunk in r.iter_content(chunk_size=8192):
-                    f.write(chunk)
+                shutil.copyfileobj(r.raw, f, length=DOWNLOAD_CHUNK_SIZE)
         return True
-    except requests.exceptions.RequestException as e:
-        print(f"Failed to download {file_url}: {e}")
+    except (requests.exceptions.RequestException, Urllib3Error) as e:
+        logger.error(f"Failed to download {file_url}: {e}")
         return False
 
 
+def download_canvas_file_to_buffer(
+    file_url, headers, session: Optional[requests.Session], timeout: int
+):
+    """Downloads a Canvas file into memory. Returns a BytesIO rewound to the start, or None."""
+    session = session or get_shared_session()
+    try:
+        with session.get(file_url, headers=headers, stream=True, timeout=timeout) as r:
+            r.raise_for_status()
+            r.raw.decode_content = True
+            buffer = io.BytesIO()
+            shutil.copyfileobj(r.raw, buffer, length=DOWNLOAD_CHUNK_SIZE)
+        buffer.seek(0)
+        return buffer
+    except (requests.exceptions.RequestException, Urllib3Error) as e:
+        logger.error(f"Failed to download {file_url}: {e}")
+        return None
+
+
 # --- Main Sync Logic ---
 
 
@@ -810,13 +1704,17 @@ def process_canvas_file(
     file_size = file_info.get("size")
     file_updated_at = file_info.get("updated_at")
 
-    if (
-        not all([file_id, filename, file_download_url])
-        or file_id in processed_canvas_file_ids
-    ):
+    if not all([file_id, filename, file_download_url]):
         return 0
+    with _PROCESSED_IDS_LOCK:
+        if file_id in processed_canvas_file_ids:
+            return 0
+        processed_canvas_file_ids.add(file_id)
 
-    processed_canvas_file_ids.add(file_id)
+    if _sync_state.is_unchanged(
+        folder_path_or_id, filename, file_updated_at, file_size
+    ):
+        return 0  # Synced from this Canvas version on a previous run
 
     # Get existing file metadata
     if storage_type == "google_drive":
@@ -828,45 +1726,289 @@ def process_canvas_file(
             folder_path_or_id, filename
         )
 
-    # Check if file has changed
-    if not has_file_changed(
+    # Check if file has changed; a same-size copy whose Canvas timestamp moved
+    # is confirmed with a HEAD request before downloading it again
+    unchanged = not has_file_changed(
         existing_metadata, canvas_size=file_size, canvas_updated_at=file_updated_at
+    )
+    if (
+        not unchanged
+        and existing_metadata
+        and file_size == existing_metadata["size"]
+        and canvas_file_content_unchanged(
+            file_download_url, existing_metadata, canvas_headers, session, timeout
+        )
     ):
+        unchanged = True
+        if storage_type != "google_drive":
+            # Move the local mtime up to Canvas' updated_at so the next run's
+            # timestamp check passes without repeating the HEAD request
+            canvas_time = _parse_iso_utc(file_updated_at)
+            if canvas_time is not None:
+                ts = canvas_time.timestamp()
+                try:
+                    os.utime(os.path.join(folder_path_or_id, filename), (ts, ts))
+                except OSError as error:
+                    logger.warning(f"Could not update mtime of '{filename}': {error}")
+    if unchanged:
+        if storage_type == "google_drive":
+            _sync_state.record(folder_path_or_id, filename, file_updated_at, file_size)
         return 0  # No change
 
-    print(f"{'Updating' if existing_metadata else 'New'} file found: '{filename}'")
-    local_filepath = os.path.join(DOWNLOAD_DIR, filename)
-    if download_canvas_file(
-        file_download_url, local_filepath, canvas_headers, session, timeout
+    logger.info(
+        f"{'Updating' if existing_metadata else 'New'} file found: '{filename}'"
+    )
+    existing_file_id = existing_metadata.get("id") if existing_metadata else None
+    local_filepath = None
+    if (
+        storage_type == "google_drive"
+        and file_size is not None
+        and file_size <= DRIVE_STREAM_UPLOAD_MAX_BYTES
     ):
-        existing_file_id = existing_metadata.get("id") if existing_metadata else None
+        # Small files go from Canvas to Drive through memory, skipping the temp file
+        buffer = download_canvas_file_to_buffer(
+            file_download_url, canvas_headers, session, timeout
+        )
+        success = buffer is not None and upload_stream_to_drive(
+            drive_service,
+            buffer,
+            filename,
+            folder_path_or_id,
+            existing_file_id,
+            drive_chunk_size_mb=drive_chunk_size_mb,
+        )
+    else:
+        # Prefix with the file ID so concurrent downloads of same-named files don't collide
+        local_filepath = os.path.join(DOWNLOAD_DIR, f"{file_id}_{filename}")
+        success = False
+        if download_canvas_file(
+            file_download_url, local_filepath, canvas_headers, session, timeout
+        ):
+            if storage_type == "google_drive":
+                success = upload_file_to_drive(
+                    drive_service,
+                    local_filepath,
+                    filename,
+                    folder_path_or_id,
+                    existing_file_id,
+                    drive_chunk_size_mb=drive_chunk_size_mb,
+                )
+            else:  # local storage
+                success = save_file_locally(local_filepath, filename, folder_path_or_id)
+
+    if success:
         if storage_type == "google_drive":
-            success = upload_file_to_drive(
-                drive_service,
-                local_filepath,
+            _sync_state.record(folder_path_or_id, filename, file_updated_at, file_size)
+        # Record in summary
+        if summary and course_name and dest_label:
+            summary.add_file(
+                course_name,
+                dest_label,
                 filename,
+                "updated" if existing_metadata else "created",
+            )
+        return 1
+    # If save/upload failed, remove the downloaded file
+    if local_filepath:
+        try:
+            os.remove(local_filepath)
+        except FileNotFoundError:
+            pass
+    return 0
+
+
+def process_files_concurrently(
+    file_infos,
+    folder_path_or_id,
+    processed_canvas_file_ids,
+    canvas_headers,
+    storage_type,
+    drive_service=None,
+    local_root_dir=None,
+    session: Optional[requests.Session] = None,
+    timeout: int = DEFAULT_REQUEST_TIMEOUT,
+    drive_chunk_size_mb: int = DEFAULT_DRIVE_CHUNK_SIZE_MB,
+    summary: Optional[SummaryCollector] = None,
+    course_name: Optional[str] = None,
+    dest_label: Optional[str] = None,
+    max_workers: int = DEFAULT_FILE_WORKERS,
+    executor: Optional[ThreadPoolExecutor] = None,
+):
+    """Runs process_canvas_file for several files on a bounded thread pool.
+
+    Downloads and uploads are network-bound, so overlapping them cuts wall time.
+    Pass main's long-lived file pool as executor so its threads, and the Drive
+    client each one builds, are reused across calls; without one a temporary
+    pool of max_workers threads is used. Returns the number of files synced.
+    """
+    if not file_infos:
+        return 0
+
+    def worker(file_info):
+        try:
+            return process_canvas_file(
+                file_info,
                 folder_path_or_id,
-                existing_file_id,
+                processed_canvas_file_ids,
+                canvas_headers,
+                storage_type,
+                _get_thread_drive_service(drive_service),
+                local_root_dir,
+                session=session,
+                timeout=timeout,
                 drive_chunk_size_mb=drive_chunk_size_mb,
+                summary=summary,
+                course_name=course_name,
+                dest_label=dest_label,
             )
-        else:  # local storage
-            success = save_file_locally(local_filepath, filename, folder_path_or_id)
+        except Exception as e:
+            logger.error(
+                f"An unexpected error occurred processing file '{file_info.get('display_name')}': {e}"
+            )
+            return 0
 
-        if success:
-            # Record in summary
-            if summary and course_name and dest_label:
-                summary.add_file(
-                    course_name,
-                    dest_label,
-                    filename,
-                    "updated" if existing_metadata else "created",
-                )
-            return 1
-        else:
-            # If save/upload failed, remove the downloaded file
-            if os.path.exists(local_filepath):
-                os.remove(local_filepath)
-    return 0
+    if len(file_infos) == 1 or (executor is None and max_workers <= 1):
+        return sum(worker(file_info) for file_info in file_infos)
+    if executor is not None:
+        return sum(executor.map(_in_log_course(worker), file_infos))
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(file_infos))) as executor:
+        return sum(executor.map(_in_log_course(worker), file_infos))
+
+
+def fetch_canvas_file_infos(
+    file_ids,
+    canvas_api_url: str,
+    canvas_headers: dict,
+    session: Optional[requests.Session] = None,
+    timeout: int = DEFAULT_REQUEST_TIMEOUT,
+    max_workers: int = DEFAULT_PAGINATION_WORKERS,
+) -> List[Dict]:
+    """Fetches Canvas file metadata for several file IDs concurrently.
+
+    Failed lookups are reported and skipped. Results keep the order of file_ids.
+    Successful lookups are kept in _canvas_file_infos for the rest of the run.
+    """
+    session = session or get_shared_session()
+    file_ids = list(dict.fromkeys(file_ids))
+    if not file_ids:
+        return []
+
+    def fetch(file_id):
+        cached_info = _canvas_file_infos.get(str(file_id))
+        if cached_info is not None:
+            return cached_info
+        file_api_url = f"{canvas_api_url}/api/v1/files/{file_id}"
+        try:
+            resp = session.get(file_api_url, headers=canvas_headers, timeout=timeout)
+            resp.raise_for_status()
+            file_info = resp.json()
+            _canvas_file_infos[str(file_id)] = file_info
+            return file_info
+        except (requests.RequestException, ValueError) as e:
+            logger.warning(f"Could not fetch linked file {file_id}: {e}")
+            return None
+
+    uncached = [fid for fid in file_ids if str(fid) not in _canvas_file_infos]
+    if max_workers <= 1 or len(uncached) <= 1:
+        results = [fetch(file_id) for file_id in file_ids]
+    else:
+        with ThreadPoolExecutor(
+            max_workers=min(max_workers, len(file_ids))
+        ) as executor:
+            results = list(executor.map(_in_log_course(fetch), file_ids))
+    return [info for info in results if info]
+
+
+def _minimal_assignment_pdf(title: str) -> Optional[bytes]:
+    """Render the PDF of an assignment that has only a title, without ReportLab.
+
+    Draws the title, "Due: N/A" and "Points: N/A" at the baselines the full
+    path's SimpleDocTemplate would use, derived from the frame margins and the
+    _TITLE_STYLE/_NORMAL_STYLE metrics. Returns None when the title needs more
+    than WinAnsi encoding or one line, or would have its whitespace collapsed
+    by Paragraph, so the caller can fall back to ReportLab.
+    """
+    try:
+        encoded_title = title.encode("cp1252")
+    except UnicodeEncodeError:
+        return None
+    if " ".join(title.split()) != title:
+        return None
+    page_width, page_height = letter
+    left = inch + _FRAME_PADDING
+    if (
+        stringWidth(title, _TITLE_STYLE.fontName, _TITLE_STYLE.fontSize)
+        > page_width - 2 * left
+    ):
+        return None
+    encoded_title = (
+        encoded_title.replace(b"\\", b"\\\\")
+        .replace(b"(", b"\\(")
+        .replace(b")", b"\\)")
+    )
+
+    # Mirror the full path: title, Spacer(12), Due, Spacer(6), Points. A
+    # Paragraph's first baseline sits fontSize below the top of its block.
+    title_top = page_height - inch - _FRAME_PADDING
+    due_top = (
+        title_top
+        - _TITLE_STYLE.leading
+        - _TITLE_STYLE.spaceAfter
+        - 12
+        - _NORMAL_STYLE.spaceBefore
+    )
+    points_top = (
+        due_top
+        - _NORMAL_STYLE.leading
+        - _NORMAL_STYLE.spaceAfter
+        - 6
+        - _NORMAL_STYLE.spaceBefore
+    )
+    normal_size = _NORMAL_STYLE.fontSize
+    stream = (
+        b"BT /F2 %g Tf %g %g Td (%s) Tj ET\n"
+        b"BT /F2 %g Tf %g %g Td (Due:) Tj /F1 %g Tf ( N/A) Tj ET\n"
+        b"BT /F2 %g Tf %g %g Td (Points:) Tj /F1 %g Tf ( N/A) Tj ET\n"
+        % (
+            _TITLE_STYLE.fontSize,
+            left,
+            title_top - _TITLE_STYLE.fontSize,
+            encoded_title,
+            normal_size,
+            left,
+            due_top - normal_size,
+            normal_size,
+            normal_size,
+            left,
+            points_top - normal_size,
+            normal_size,
+        )
+    )
+    objects = [
+        b"<< /Type /Catalog /Pages 2 0 R >>",
+        b"<< /Type /Pages /Kids [3 0 R] /Count 1 >>",
+        b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 %d %d] "
+        b"/Resources << /Font << /F1 4 0 R /F2 5 0 R >> >> /Contents 6 0 R >>"
+        % (page_width, page_height),
+        b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica "
+        b"/Encoding /WinAnsiEncoding >>",
+        b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica-Bold "
+        b"/Encoding /WinAnsiEncoding >>",
+        b"<< /Length %d >>\nstream\n%sendstream" % (len(stream), stream),
+    ]
+    pdf = bytearray(b"%PDF-1.4\n")
+    offsets = []
+    for number, body in enumerate(objects, start=1):
+        offsets.append(len(pdf))
+        pdf += b"%d 0 obj\n%s\nendobj\n" % (number, body)
+    xref_offset = len(pdf)
+    pdf += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1)
+    pdf += b"".join(b"%010d 00000 n \n" % offset for offset in offsets)
+    pdf += b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (
+        len(objects) + 1,
+        xref_offset,
+    )
+    return bytes(pdf)
 
 
 def process_canvas_assignment(
@@ -884,10 +2026,21 @@ def process_canvas_assignment(
     drive_chunk_size_mb: int = DEFAULT_DRIVE_CHUNK_SIZE_MB,
     summary: Optional[SummaryCollector] = None,
     course_name: Optional[str] = None,
+    file_workers: int = DEFAULT_FILE_WORKERS,
+    assignment_folder_id: Optional[str] = None,
+    upload_executor: Optional[ThreadPoolExecutor] = None,
+    pending_uploads: Optional[list] = None,
+    file_executor: Optional[ThreadPoolExecutor] = None,
 ):
-    """Saves an assignment's details and linked files."""
-    if session is None:
-        session = requests.Session()
+    """Saves an assignment's details and linked files.
+
+    assignment_folder_id may carry a Drive folder already resolved by
+    ensure_folders, which skips the per-assignment folder lookup. In Drive mode,
+    passing upload_executor and pending_uploads moves the PDF upload off the
+    calling thread: a future yielding 1/0 is appended to pending_uploads and is
+    not included in the returned count.
+    """
+    session = session or get_shared_session()
     new_items_count = 0
     assignment_name = assignment_info.get("name")
     description = assignment_info.get("description")
@@ -904,7 +2057,7 @@ def process_canvas_assignment(
 
     # Create a dedicated subfolder for the assignment
     if storage_type == "google_drive":
-        assignment_storage_path = get_or_create_folder(
+        assignment_storage_path = assignment_folder_id or get_or_create_folder(
             drive_service,
             assignment_folder_name,
             parent_id=assignments_root_path_or_id,
@@ -931,238 +2084,213 @@ def process_canvas_assignment(
         # Still need to process linked files, but skip PDF generation
         pass
     else:
-        print(
+        logger.info(
             f"{'Updating' if existing_metadata else 'New'} assignment found: '{assignment_name}'"
         )
-        local_pdf_path = os.path.join(DOWNLOAD_DIR, pdf_filename)
         try:
-            # Create PDF document
-            doc = SimpleDocTemplate(local_pdf_path, pagesize=letter)
-            styles = getSampleStyleSheet()
-
-            # Create custom styles
-            title_style = ParagraphStyle(
-                "CustomTitle",
-                parent=styles["Heading1"],
-                fontSize=16,
-                spaceAfter=30,
-            )
-            normal_style = styles["Normal"]
-            bold_style = styles["Normal"]
-            bold_style.fontName = "Helvetica-Bold"
-
-            # Build PDF content
-            content = []
-
-            # Title
-            escaped_assignment_name = html.escape(assignment_name, quote=False)
-            content.append(Paragraph(escaped_assignment_name, title_style))
-            content.append(Spacer(1, 12))
-
-            # Due date
-            if due_at:
-                escaped_due_at = html.escape(str(due_at), quote=False)
-                content.append(Paragraph(f"<b>Due:</b> {escaped_due_at}", normal_style))
+            # Title-only assignments skip ReportLab (see _minimal_assignment_pdf)
+            pdf_bytes = None
+            if MINIMAL_ASSIGNMENT_PDF_FAST_PATH and not (
+                rubric or description or due_at or points_possible
+            ):
+                pdf_bytes = _minimal_assignment_pdf(assignment_name)
+            if pdf_bytes is not None:
+                pdf_buffer = io.BytesIO(pdf_bytes)
             else:
-                content.append(Paragraph("<b>Due:</b> N/A", normal_style))
-            content.append(Spacer(1, 6))
+                # Build the PDF in memory; it is uploaded/saved straight from the buffer
+                pdf_buffer = io.BytesIO()
+                doc = SimpleDocTemplate(pdf_buffer, pagesize=letter)
 
-            # Points
-            if points_possible:
-                escaped_points = html.escape(str(points_possible), quote=False)
-                content.append(
-                    Paragraph(f"<b>Points:</b> {escaped_points}", normal_style)
-                )
-            else:
-                content.append(Paragraph("<b>Points:</b> N/A", normal_style))
-            content.append(Spacer(1, 12))
+                # Build PDF content
+                content = []
 
-            # Rubric
-            if rubric and len(rubric) > 0:
-                content.append(Paragraph("<b>Rubric:</b>", bold_style))
+                # Title
+                escaped_assignment_name = _esc(assignment_name)
+                content.append(Paragraph(escaped_assignment_name, _TITLE_STYLE))
+                content.append(Spacer(1, 12))
+
+                # Due date
+                if due_at:
+                    escaped_due_at = _esc(str(due_at))
+                    content.append(
+                        Paragraph(f"<b>Due:</b> {escaped_due_at}", _NORMAL_STYLE)
+                    )
+                else:
+                    content.append(Paragraph("<b>Due:</b> N/A", _NORMAL_STYLE))
                 content.append(Spacer(1, 6))
 
-                try:
-                    for criterion in rubric:
-                        if isinstance(criterion, dict):
-                            criterion_desc = criterion.get("description", "")
-                            criterion_long_desc = criterion.get("long_description", "")
-                            criterion_points = criterion.get("points", 0)
-
-                            if criterion_desc:
-                                escaped_criterion_desc = html.escape(
-                                    criterion_desc, quote=False
+                # Points
+                if points_possible:
+                    escaped_points = _esc(str(points_possible))
+                    content.append(
+                        Paragraph(f"<b>Points:</b> {escaped_points}", _NORMAL_STYLE)
+                    )
+                else:
+                    content.append(Paragraph("<b>Points:</b> N/A", _NORMAL_STYLE))
+                content.append(Spacer(1, 12))
+
+                # Rubric
+                if rubric and len(rubric) > 0:
+                    content.append(Paragraph("<b>Rubric:</b>", _BOLD_STYLE))
+                    content.append(Spacer(1, 6))
+
+                    try:
+                        for criterion in rubric:
+                            if isinstance(criterion, dict):
+                                criterion_desc = criterion.get("description", "")
+                                criterion_long_desc = criterion.get(
+                                    "long_description", ""
                                 )
-                                criterion_text = f"<b>{escaped_criterion_desc}</b> ({criterion_points} points)"
-                                content.append(Paragraph(criterion_text, normal_style))
-
-                                # Add criterion long description if available
-                                if (
-                                    criterion_long_desc
-                                    and criterion_long_desc.strip()
-                                    and criterion_long_desc != criterion_desc
-                                ):
-                                    # Process HTML content properly with safe fallback
-                                    html_elements = html_to_pdf_elements(
-                                        f"<i>{criterion_long_desc}</i>", styles
+                                criterion_points = criterion.get("points", 0)
+
+                                if criterion_desc:
+                                    escaped_criterion_desc = _esc(criterion_desc)
+                                    criterion_text = f"<b>{escaped_criterion_desc}</b> ({criterion_points} points)"
+                                    content.append(
+                                        Paragraph(criterion_text, _NORMAL_STYLE)
                                     )
-                                    if html_elements:
-                                        content.extend(html_elements)
-                                    else:
-                                        # Fallback to plain text if inline-only content produced nothing
-                                        try:
-                                            from bs4 import BeautifulSoup as _BS
-
-                                            plain = _BS(
-                                                criterion_long_desc, "html.parser"
-                                            ).get_text(" ", strip=True)
-                                        except Exception:
-                                            plain = criterion_long_desc
-                                        if plain and plain.strip():
-                                            content.append(
-                                                Paragraph(
-                                                    f"<i>{html.escape(plain, quote=False)}</i>",
-                                                    normal_style,
-                                                )
-                                            )
-                                    content.append(Spacer(1, 3))
-                                else:
-                                    content.append(Spacer(1, 3))
-
-                            # Add ratings if available
-                            ratings = criterion.get("ratings", [])
-                            if ratings and isinstance(ratings, list):
-                                for rating in ratings:
-                                    if isinstance(rating, dict):
-                                        rating_desc = rating.get("description", "")
-                                        rating_long_desc = rating.get(
-                                            "long_description", ""
-                                        )
-                                        rating_small_desc = rating.get(
-                                            "small_description", ""
-                                        )
-                                        rating_points = rating.get("points", 0)
 
-                                        if rating_desc:
-                                            escaped_rating_desc = html.escape(
-                                                rating_desc, quote=False
+                                    # Add criterion long description if available
+                                    if (
+                                        criterion_long_desc
+                                        and criterion_long_desc.strip()
+                                        and criterion_long_desc != criterion_desc
+                                    ):
+                                        # Process HTML content properly with safe fallback
+                                        html_elements = html_to_pdf_elements(
+                                            f"<i>{criterion_long_desc}</i>", _STYLES
+                                        )
+                                        if html_elements:
+                                            content.extend(html_elements)
+                                        else:
+                                            # Fallback to plain text if inline-only content produced nothing
+                                            plain = _html_to_plain(criterion_long_desc)
+                                            if plain and plain.strip():
+                                                content.append(
+                                                    Paragraph(
+                                                        f"<i>{_esc(plain)}</i>",
+                                                        _NORMAL_STYLE,
+                                                    )
+                                                )
+                                        content.append(Spacer(1, 3))
+                                    else:
+                                        content.append(Spacer(1, 3))
+
+                                # Add ratings if available
+                                ratings = criterion.get("ratings", [])
+                                if ratings and isinstance(ratings, list):
+                                    for rating in ratings:
+                                        if isinstance(rating, dict):
+                                            rating_desc = rating.get("description", "")
+                                            rating_long_desc = rating.get(
+                                                "long_description", ""
                                             )
-                                            rating_text = f"  • {escaped_rating_desc} ({rating_points} points)"
-                                            content.append(
-                                                Paragraph(rating_text, normal_style)
+                                            rating_small_desc = rating.get(
+                                                "small_description", ""
                                             )
-
-                                            # Add long description if available and different from main description
-                                            if (
-                                                rating_long_desc
-                                                and rating_long_desc.strip()
-                                                and rating_long_desc != rating_desc
-                                            ):
-                                                # Process HTML content properly with safe fallback
-                                                html_elements = html_to_pdf_elements(
-                                                    f"    <i>{rating_long_desc}</i>",
-                                                    styles,
+                                            rating_points = rating.get("points", 0)
+
+                                            if rating_desc:
+                                                escaped_rating_desc = _esc(rating_desc)
+                                                rating_text = f"  • {escaped_rating_desc} ({rating_points} points)"
+                                                content.append(
+                                                    Paragraph(
+                                                        rating_text, _NORMAL_STYLE
+                                                    )
                                                 )
-                                                if html_elements:
-                                                    content.extend(html_elements)
-                                                else:
-                                                    try:
-                                                        from bs4 import (
-                                                            BeautifulSoup as _BS,
-                                                        )
 
-                                                        plain = _BS(
-                                                            rating_long_desc,
-                                                            "html.parser",
-                                                        ).get_text(" ", strip=True)
-                                                    except Exception:
-                                                        plain = rating_long_desc
-                                                    if plain and plain.strip():
-                                                        content.append(
-                                                            Paragraph(
-                                                                f"<i>{html.escape(plain, quote=False)}</i>",
-                                                                normal_style,
-                                                            )
+                                                # Add long description if available and different from main description
+                                                if (
+                                                    rating_long_desc
+                                                    and rating_long_desc.strip()
+                                                    and rating_long_desc != rating_desc
+                                                ):
+                                                    # Process HTML content properly with safe fallback
+                                                    html_elements = html_to_pdf_elements(
+                                                        f"    <i>{rating_long_desc}</i>",
+                                                        _STYLES,
+                                                    )
+                                                    if html_elements:
+                                                        content.extend(html_elements)
+                                                    else:
+                                                        plain = _html_to_plain(
+                                                            rating_long_desc
                                                         )
-                                                content.append(Spacer(1, 2))
-
-                                            # Add small description if available and different
-                                            elif (
-                                                rating_small_desc
-                                                and rating_small_desc.strip()
-                                                and rating_small_desc != rating_desc
-                                            ):
-                                                # Process HTML content properly with safe fallback
-                                                html_elements = html_to_pdf_elements(
-                                                    f"    <i>{rating_small_desc}</i>",
-                                                    styles,
-                                                )
-                                                if html_elements:
-                                                    content.extend(html_elements)
-                                                else:
-                                                    try:
-                                                        from bs4 import (
-                                                            BeautifulSoup as _BS,
-                                                        )
-
-                                                        plain = _BS(
-                                                            rating_small_desc,
-                                                            "html.parser",
-                                                        ).get_text(" ", strip=True)
-                                                    except Exception:
-                                                        plain = rating_small_desc
-                                                    if plain and plain.strip():
-                                                        content.append(
-                                                            Paragraph(
-                                                                f"<i>{html.escape(plain, quote=False)}</i>",
-                                                                normal_style,
+                                                        if plain and plain.strip():
+                                                            content.append(
+                                                                Paragraph(
+                                                                    f"<i>{_esc(plain)}</i>",
+                                                                    _NORMAL_STYLE,
+                                                                )
                                                             )
+                                                    content.append(Spacer(1, 2))
+
+                                                # Add small description if available and different
+                                                elif (
+                                                    rating_small_desc
+                                                    and rating_small_desc.strip()
+                                                    and rating_small_desc != rating_desc
+                                                ):
+                                                    # Process HTML content properly with safe fallback
+                                                    html_elements = html_to_pdf_elements(
+                                                        f"    <i>{rating_small_desc}</i>",
+                                                        _STYLES,
+                                                    )
+                                                    if html_elements:
+                                                        content.extend(html_elements)
+                                                    else:
+                                                        plain = _html_to_plain(
+                                                            rating_small_desc
                                                         )
-                                                content.append(Spacer(1, 2))
-                                content.append(Spacer(1, 6))
-                    content.append(Spacer(1, 12))
-                except Exception as e:
-                    escaped_error = html.escape(str(e), quote=False)
-                    content.append(
-                        Paragraph(
-                            f"<i>Error processing rubric: {escaped_error}</i>",
-                            normal_style,
+                                                        if plain and plain.strip():
+                                                            content.append(
+                                                                Paragraph(
+                                                                    f"<i>{_esc(plain)}</i>",
+                                                                    _NORMAL_STYLE,
+                                                                )
+                                                            )
+                                                    content.append(Spacer(1, 2))
+                                    content.append(Spacer(1, 6))
+                        content.append(Spacer(1, 12))
+                    except Exception as e:
+                        escaped_error = _esc(str(e))
+                        content.append(
+                            Paragraph(
+                                f"<i>Error processing rubric: {escaped_error}</i>",
+                                _NORMAL_STYLE,
+                            )
                         )
-                    )
-                    content.append(Spacer(1, 12))
+                        content.append(Spacer(1, 12))
 
-            # Separator
-            content.append(Paragraph("<hr/>", normal_style))
-            content.append(Spacer(1, 12))
+                # Separator
+                content.append(Paragraph("<hr/>", _NORMAL_STYLE))
+                content.append(Spacer(1, 12))
 
-            # Description
-            if description:
-                # Convert HTML to formatted PDF elements
-                html_elements = html_to_pdf_elements(description, styles)
-                content.extend(html_elements)
+                # Description
+                if description:
+                    # Convert HTML to formatted PDF elements
+                    html_elements = html_to_pdf_elements(description, _STYLES)
+                    content.extend(html_elements)
 
-            # Generate PDF
-            doc.build(content)
+                # Generate PDF
+                doc.build(content)
 
             existing_file_id = (
                 existing_metadata.get("id") if existing_metadata else None
             )
-            if storage_type == "google_drive":
-                success = upload_file_to_drive(
-                    drive_service,
-                    local_pdf_path,
+
+            def store_pdf():
+                success = store_buffer(
+                    pdf_buffer,
                     pdf_filename,
+                    storage_type,
                     assignment_storage_path,
+                    _get_thread_drive_service(drive_service),
                     existing_file_id,
+                    drive_chunk_size_mb=drive_chunk_size_mb,
                 )
-            else:
-                success = save_file_locally(
-                    local_pdf_path,
-                    pdf_filename,
-                    assignment_storage_path,
-                )
-            if success:
-                new_items_count += 1
+                if not success:
+                    return 0
                 # Record in summary
                 if summary and course_name:
                     dest_label = f"{course_name}/Assignments/{assignment_folder_name}"
@@ -1172,66 +2300,55 @@ def process_canvas_assignment(
                         pdf_filename,
                         "updated" if existing_metadata else "created",
                     )
-            # Clean up temporary PDF file
-            if os.path.exists(local_pdf_path):
-                try:
-                    os.remove(local_pdf_path)
-                except OSError as e:
-                    print(
-                        f"Warning: Could not remove temporary file '{local_pdf_path}': {e}"
-                    )
+                return 1
+
+            if (
+                storage_type == "google_drive"
+                and upload_executor is not None
+                and pending_uploads is not None
+            ):
+                # Upload in the background while the next assignment is rendered
+                pending_uploads.append(
+                    upload_executor.submit(_in_log_course(store_pdf))
+                )
+            else:
+                new_items_count += store_pdf()
         except Exception as e:
-            escaped_error = html.escape(str(e), quote=False)
-            print(
-                f"Could not save assignment '{assignment_name}' as PDF: {escaped_error}"
-            )
-            # Clean up temporary PDF file if it exists
-            if os.path.exists(local_pdf_path):
-                try:
-                    os.remove(local_pdf_path)
-                except OSError as e:
-                    print(
-                        f"Warning: Could not remove temporary file '{local_pdf_path}': {e}"
-                    )
+            escaped_error = _esc(str(e))
+            logger.warning(
+                f"Could not save assignment '{assignment_name}' as PDF: {escaped_error}"
+            )
 
     # Avoid listing entire folder contents to reduce API calls; rely on per-file metadata checks.
 
     # Scan the assignment description for linked files
     if description:
-        soup = BeautifulSoup(description, "html.parser")
-        for link in soup.find_all("a", href=True):
-            if not isinstance(link, Tag):
-                continue
-            href = link.get("href", "")
-            if not isinstance(href, str):
-                continue
-            match = re.search(r"/files/(\d+)", href)
-            if match:
-                file_id = match.group(1)
-                file_api_url = f"{canvas_api_url}/api/v1/files/{file_id}"
-                try:
-                    file_info_resp = session.get(
-                        file_api_url, headers=canvas_headers, timeout=timeout
-                    )
-                    file_info_resp.raise_for_status()
-                    if file_info_resp.ok:
-                        new_items_count += process_canvas_file(
-                            file_info_resp.json(),
-                            assignment_storage_path,
-                            processed_canvas_file_ids,
-                            canvas_headers,
-                            storage_type,
-                            drive_service,
-                            local_root_dir,
-                            session=session,
-                            timeout=timeout,
-                            drive_chunk_size_mb=drive_chunk_size_mb,
-                            summary=summary,
-                            course_name=course_name,
-                            dest_label=f"{course_name}/Assignments/{assignment_folder_name}",
-                        )
-                except requests.RequestException as e:
-                    print(f"Could not fetch file link from assignment: {e}")
+        linked_file_ids = _FILE_LINK_RE.findall(description)
+        linked_file_infos = fetch_canvas_file_infos(
+            linked_file_ids,
+            canvas_api_url,
+            canvas_headers,
+            session=session,
+            timeout=timeout,
+        )
+
+        new_items_count += process_files_concurrently(
+            linked_file_infos,
+            assignment_storage_path,
+            processed_canvas_file_ids,
+            canvas_headers,
+            storage_type,
+            drive_service,
+            local_root_dir,
+            session=session,
+            timeout=timeout,
+            drive_chunk_size_mb=drive_chunk_size_mb,
+            summary=summary,
+            course_name=course_name,
+            dest_label=f"{course_name}/Assignments/{assignment_folder_name}",
+            max_workers=file_workers,
+            executor=file_executor,
+        )
 
     return new_items_count
 
@@ -1243,9 +2360,17 @@ def _parse_iso_utc(dt_str: str):
     """
     if not dt_str or not isinstance(dt_str, str):
         return None
-    try:
-        from datetime import datetime, timezone
+    return _parse_iso_str(dt_str)
+
 
+# Canvas reuses the same updated_at values across a course's items, so repeat
+# strings are common; datetimes are immutable and safe to share
+@lru_cache(maxsize=4096)
+def _parse_iso_str(dt_str: str):
+    try:
+        # Fast path for Canvas' usual "YYYY-MM-DDTHH:MM:SSZ" form
+        if len(dt_str) == 20 and dt_str[-1] == "Z":
+            return datetime.fromisoformat(dt_str[:-1]).replace(tzinfo=timezone.utc)
         ds = dt_str.replace("Z", "+00:00")
         dt = datetime.fromisoformat(ds)
         # Ensure tz-aware and in UTC
@@ -1264,8 +2389,6 @@ def _to_utc_datetime(value):
     - POSIX timestamps (float/int seconds since epoch)
     Returns None if conversion fails.
     """
-    from datetime import datetime, timezone
-
     if value is None:
         return None
     if isinstance(value, (int, float)):
@@ -1280,10 +2403,14 @@ def _to_utc_datetime(value):
 
 def _max_iso_datetime(values: List[str]):
     """Return the max ISO timestamp (UTC) from a list of timestamp strings."""
+    values = [v for v in values if v]
+    # Uniform "YYYY-MM-DDTHH:MM:SSZ" strings order correctly without parsing
+    if values and all(
+        isinstance(v, str) and len(v) == 20 and v[-1] == "Z" for v in values
+    ):
+        return max(values)
     try:
-        from datetime import timezone
-
-        timestamps = [_parse_iso_utc(v) for v in values if v]
+        timestamps = [_parse_iso_utc(v) for v in values]
         timestamps = [t for t in timestamps if t]
         if not timestamps:
             return None
@@ -1330,38 +2457,26 @@ def _export_json_resource(
     course_name: Optional[str] = None,
     dest_label: Optional[str] = None,
 ):
-    """Serialize data to JSON, upload/save, record summary, and cleanup temp file."""
-    local_json_path = os.path.join(DOWNLOAD_DIR, filename)
-    try:
-        with open(local_json_path, "w", encoding="utf-8") as f:
-            json.dump(data, f, ensure_ascii=False, indent=2)
-
-        existing_file_id = existing_metadata.get("id") if existing_metadata else None
-        if storage_type == "google_drive":
-            success = upload_file_to_drive(
-                drive_service,
-                local_json_path,
-                filename,
-                folder_path_or_id,
-                existing_file_id,
-            )
-        else:
-            success = save_file_locally(local_json_path, filename, folder_path_or_id)
+    """Serialize data to JSON, upload/save from memory, and record summary."""
+    buffer = io.BytesIO(json.dumps(data, ensure_ascii=False, indent=2).encode("utf-8"))
+    existing_file_id = existing_metadata.get("id") if existing_metadata else None
+    success = store_buffer(
+        buffer,
+        filename,
+        storage_type,
+        folder_path_or_id,
+        drive_service,
+        existing_file_id,
+    )
 
-        if success and summary and course_name and dest_label:
-            summary.add_file(
-                course_name,
-                dest_label,
-                filename,
-                "updated" if existing_metadata else "created",
-            )
-        return 1 if success else 0
-    finally:
-        if os.path.exists(local_json_path):
-            try:
-                os.remove(local_json_path)
-            except OSError:
-                pass
+    if success and summary and course_name and dest_label:
+        summary.add_file(
+            course_name,
+            dest_label,
+            filename,
+            "updated" if existing_metadata else "created",
+        )
+    return 1 if success else 0
 
 
 def _get_bool_config(
@@ -1391,15 +2506,19 @@ def process_course_pages(
     timeout: int = DEFAULT_REQUEST_TIMEOUT,
     per_page: int = DEFAULT_CANVAS_PER_PAGE,
     summary: Optional[SummaryCollector] = None,
+    pages_from_api: Optional[List[Dict]] = None,
+    modules: Optional[List[Dict]] = None,
+    module_items: Optional[List[Dict]] = None,
 ):
     """Fetch all course pages, merge them into a single PDF, and upload/save if changed.
 
     - Creates/uses a "Pages" folder under the course directory.
     - Output filename: "All Pages.pdf".
     - Change detection: compares max(page.updated_at) vs existing PDF modified time.
+    - module_items may carry every module item the caller already listed, which
+      skips re-listing the course's modules here.
     """
-    if session is None:
-        session = requests.Session()
+    session = session or get_shared_session()
 
     # Build/get destination folder
     pages_folder_label = f"{course_name}/Pages"
@@ -1420,9 +2539,10 @@ def process_course_pages(
     # Fetch pages with body included (normalize base URL to avoid double slashes)
     base_url = (canvas_api_url or "").rstrip("/")
     pages_url = f"{base_url}/api/v1/courses/{course_id}/pages?include[]=body"
-    pages_from_api = get_paginated_canvas_items(
-        pages_url, canvas_headers, session, timeout, per_page, suppress_errors=True
-    )
+    if pages_from_api is None:
+        pages_from_api = get_paginated_canvas_items(
+            pages_url, canvas_headers, session, timeout, per_page, suppress_errors=True
+        )
 
     # Always also discover pages via modules to catch pages that may not appear in the main pages list
     # (e.g., pages only in modules, unpublished pages, or due to permissions)
@@ -1435,47 +2555,73 @@ def process_course_pages(
             pages_map[slug] = page
 
     # Then discover and add pages from modules (won't overwrite existing ones)
+    page_items, page_item_urls = [], set()
     try:
-        modules_url = f"{base_url}/api/v1/courses/{course_id}/modules"
-        modules = get_paginated_canvas_items(
-            modules_url,
-            canvas_headers,
-            session,
-            timeout,
-            per_page,
-            suppress_errors=True,
-        )
-        for module in modules or []:
-            items_url = f"{base_url}/api/v1/courses/{course_id}/modules/{module.get('id')}/items"
-            module_items = get_paginated_canvas_items(
-                items_url,
-                canvas_headers,
-                session,
-                timeout,
-                per_page,
-                suppress_errors=True,
-            )
-            for item in module_items or []:
-                if item.get("type") == "Page" and item.get("url"):
-                    # Fetch page details to get body and timestamps
-                    try:
-                        resp = session.get(
-                            item["url"], headers=canvas_headers, timeout=timeout
-                        )
-                        resp.raise_for_status()
-                        pd = resp.json()
-                        slug = pd.get("url") or item.get("page_url") or pd.get("title")
-                        # Only add if not already present from pages API
-                        if slug and slug not in pages_map:
-                            pages_map[slug] = {
-                                "title": pd.get("title"),
-                                "body": pd.get("body"),
-                                "updated_at": pd.get("updated_at"),
-                                "html_url": pd.get("html_url"),
-                                "url": pd.get("url"),
-                            }
-                    except requests.RequestException:
+        if module_items is None:
+            module_items = []
+            if modules is None:
+                modules_url = f"{base_url}/api/v1/courses/{course_id}/modules"
+                modules = get_paginated_canvas_items(
+                    modules_url,
+                    canvas_headers,
+                    session,
+                    timeout,
+                    per_page,
+                    suppress_errors=True,
+                )
+            for module in modules or []:
+                items_url = f"{base_url}/api/v1/courses/{course_id}/modules/{module.get('id')}/items"
+                module_items.extend(
+                    get_paginated_canvas_items(
+                        items_url,
+                        canvas_headers,
+                        session,
+                        timeout,
+                        per_page,
+                        suppress_errors=True,
+                    )
+                    or []
+                )
+        for item in module_items:
+            if (
+                item.get("type") == "Page"
+                and item.get("url")
+                and item["url"] not in page_item_urls
+                # Pages already returned by the pages API need no detail fetch
+                and item.get("page_url") not in pages_map
+            ):
+                page_item_urls.add(item["url"])
+                page_items.append(item)
+
+        def fetch_page_details(item):
+            """Fetch page details to get body and timestamps."""
+            try:
+                resp = session.get(item["url"], headers=canvas_headers, timeout=timeout)
+                resp.raise_for_status()
+                return item, resp.json()
+            except requests.RequestException:
+                return item, None
+
+        if page_items:
+            with ThreadPoolExecutor(
+                max_workers=min(DEFAULT_PAGE_FETCH_WORKERS, len(page_items))
+            ) as executor:
+                # map() keeps module order, so the first module listing a page wins
+                for item, pd in executor.map(
+                    _in_log_course(fetch_page_details), page_items
+                ):
+                    if pd is None:
                         continue
+                    slug = pd.get("url") or item.get("page_url") or pd.get("title")
+                    # Only add if not already present from pages API
+                    if slug and slug not in pages_map:
+                        pages_map[slug] = {
+                            "title": pd.get("title"),
+                            "body": pd.get("body"),
+                            "updated_at": pd.get("updated_at"),
+                            "html_url": pd.get("html_url"),
+                            "url": pd.get("url"),
+                        }
     except Exception:
         # If module discovery fails, continue with just the pages from API
         pass
@@ -1486,28 +2632,18 @@ def process_course_pages(
     if not pages:
         return 0
 
-    # Sort pages for a stable order (by title)
-    try:
-        pages.sort(key=lambda p: (p.get("title") or "").lower())
-    except Exception:
-        pass
+    # Sort pages for a stable order (by title); keys are computed once per page
+    pages = [
+        page
+        for _, _, page in sorted(
+            ((page.get("title") or "").casefold(), i, page)
+            for i, page in enumerate(pages)
+        )
+    ]
 
     # Determine if anything changed by checking the newest updated_at across pages
-    max_updated_at_iso = None
-    try:
-        page_times = [p.get("updated_at") for p in pages if p.get("updated_at")]
-        if page_times:
-            # Convert to datetime then back to ISO for consistent compare usage
-            from datetime import timezone
-
-            dts = [_parse_iso_utc(t) for t in page_times]
-            dts = [dt for dt in dts if dt is not None]
-            if dts:
-                max_dt = max(dts)
-                max_updated_at_iso = max_dt.astimezone(timezone.utc).isoformat()
-    except Exception:
-        # If we can't compute max time, fallback to regenerating (safer)
-        max_updated_at_iso = None
+    # (None when no time can be determined, which forces a rebuild)
+    max_updated_at_iso = _max_timestamp_from_items(pages, ["updated_at"])
 
     # Existing metadata lookup
     if storage_type == "google_drive":
@@ -1532,12 +2668,11 @@ def process_course_pages(
     if not should_rebuild:
         return 0
 
-    print(
+    logger.info(
         f"{'Updating' if existing_metadata else 'New'} course pages bundle for '{course_name}'"
     )
 
-    # Create PDF
-    local_pdf_path = os.path.join(DOWNLOAD_DIR, output_filename)
+    # Create PDF (in memory; uploaded/saved straight from the buffer)
     try:
         # Custom DocTemplate to capture headings for TOC and create bookmarks
         class TOCDocTemplate(SimpleDocTemplate):
@@ -1563,56 +2698,51 @@ def process_course_pages(
                     # Don't block PDF build if TOC capture fails
                     pass
 
-        doc = TOCDocTemplate(local_pdf_path, pagesize=letter)
-        styles = getSampleStyleSheet()
-
-        title_style = ParagraphStyle(
-            "CoursePagesTitle", parent=styles["Heading1"], fontSize=18, spaceAfter=24
-        )
-        page_title_style = ParagraphStyle(
-            "PageTitle", parent=styles["Heading2"], fontSize=14, spaceAfter=12
-        )
-        toc_title_style = ParagraphStyle(
-            "TOCTitle", parent=styles["Heading2"], fontSize=14, spaceAfter=6
-        )
-        link_style = ParagraphStyle(
-            "PageLink",
-            parent=styles["Normal"],
-            textColor=blue,
-            underline=True,
-            spaceAfter=6,
-        )
+        pdf_buffer = io.BytesIO()
+        doc = TOCDocTemplate(pdf_buffer, pagesize=letter)
 
         content = []
         # Top title
-        content.append(Paragraph(html.escape(f"{course_name} — Pages"), title_style))
+        content.append(
+            Paragraph(html.escape(f"{course_name} — Pages"), _COURSE_PAGES_TITLE_STYLE)
+        )
         content.append(Spacer(1, 12))
 
         # Table of Contents section (simple internal links, no page numbers)
-        content.append(Paragraph("Table of Contents", toc_title_style))
+        content.append(Paragraph("Table of Contents", _TOC_TITLE_STYLE))
         content.append(Spacer(1, 4))
-        for i, p in enumerate(pages, start=1):
-            t = html.escape(p.get("title") or "Untitled Page", quote=False)
-            content.append(Paragraph(f'<link href="#h{i}">{t}</link>', link_style))
+        # Titles are escaped once and shared by the TOC and the page headings
+        safe_titles = [_esc(p.get("title") or "Untitled Page") for p in pages]
+        content.extend(
+            [
+                Paragraph(f'<link href="#h{i}">{t}</link>', _LINK_STYLE)
+                for i, t in enumerate(safe_titles, start=1)
+            ]
+        )
         content.append(PageBreak())
 
+        # Origin for Canvas page links that lack html_url (parsed once, not per page)
+        try:
+            parsed_api = urlparse(canvas_api_url)
+        except ValueError:
+            parsed_api = None
+        canvas_origin = (
+            f"{parsed_api.scheme}://{parsed_api.netloc}"
+            if parsed_api and parsed_api.scheme and parsed_api.netloc
+            else None
+        )
+
         # Add each page
         for idx, page in enumerate(pages):
-            title = page.get("title") or "Untitled Page"
             body = page.get("body") or ""
             page_url = page.get("html_url")
             if not page_url:
                 # Fallback to construct from slug if available
                 slug = page.get("url")
-                try:
-                    parsed = urlparse(canvas_api_url)
-                    if parsed.scheme and parsed.netloc and slug:
-                        page_url = f"{parsed.scheme}://{parsed.netloc}/courses/{course_id}/pages/{slug}"
-                except Exception:
-                    page_url = None
+                if canvas_origin and slug:
+                    page_url = f"{canvas_origin}/courses/{course_id}/pages/{slug}"
 
-            safe_title = html.escape(title, quote=False)
-            content.append(Paragraph(safe_title, page_title_style))
+            content.append(Paragraph(safe_titles[idx], _PAGE_TITLE_STYLE))
             content.append(Spacer(1, 6))
 
             # External link back to Canvas page (if resolvable)
@@ -1620,12 +2750,12 @@ def process_course_pages(
                 safe_url = html.escape(page_url, quote=True)
                 content.append(
                     Paragraph(
-                        f'<link href="{safe_url}">View on Canvas</link>', link_style
+                        f'<link href="{safe_url}">View on Canvas</link>', _LINK_STYLE
                     )
                 )
 
             if body:
-                html_elements = html_to_pdf_elements(body, styles)
+                html_elements = html_to_pdf_elements(body, _STYLES)
                 if html_elements:
                     content.extend(html_elements)
             # Add a page break between pages, except after the last one
@@ -1636,28 +2766,15 @@ def process_course_pages(
         doc.build(content)
 
         # Upload/Save
-        if storage_type == "google_drive":
-            existing_file_id = (
-                existing_metadata.get("id") if existing_metadata else None
-            )
-            success = upload_file_to_drive(
-                drive_service,
-                local_pdf_path,
-                output_filename,
-                pages_folder_path_or_id,
-                existing_file_id,
-            )
-        else:
-            success = save_file_locally(
-                local_pdf_path, output_filename, pages_folder_path_or_id
-            )
-
-        # Cleanup temp
-        if os.path.exists(local_pdf_path):
-            try:
-                os.remove(local_pdf_path)
-            except OSError:
-                pass
+        existing_file_id = existing_metadata.get("id") if existing_metadata else None
+        success = store_buffer(
+            pdf_buffer,
+            output_filename,
+            storage_type,
+            pages_folder_path_or_id,
+            drive_service,
+            existing_file_id,
+        )
 
         if success:
             # Record summary
@@ -1670,13 +2787,9 @@ def process_course_pages(
                 )
             return 1
     except Exception as e:
-        print(f"Failed to build/upload merged pages PDF for '{course_name}': {e}")
-        # Cleanup temp if present
-        if os.path.exists(local_pdf_path):
-            try:
-                os.remove(local_pdf_path)
-            except OSError:
-                pass
+        logger.error(
+            f"Failed to build/upload merged pages PDF for '{course_name}': {e}"
+        )
 
     return 0
 
@@ -1694,8 +2807,7 @@ def process_course_announcements(
     per_page: int = DEFAULT_CANVAS_PER_PAGE,
     summary: Optional[SummaryCollector] = None,
 ):
-    if session is None:
-        session = requests.Session()
+    session = session or get_shared_session()
 
     base_url = (canvas_api_url or "").rstrip("/")
     announcements_url = (
@@ -1728,7 +2840,7 @@ def process_course_announcements(
     if not _should_regenerate_resource(existing_metadata, latest_ts):
         return 0
 
-    print(
+    logger.info(
         f"{'Updating' if existing_metadata else 'New'} announcements for '{course_name}'"
     )
     reports_label = f"{course_name}/Reports"
@@ -1758,8 +2870,7 @@ def process_course_discussions(
     per_page: int = DEFAULT_CANVAS_PER_PAGE,
     summary: Optional[SummaryCollector] = None,
 ):
-    if session is None:
-        session = requests.Session()
+    session = session or get_shared_session()
 
     base_url = (canvas_api_url or "").rstrip("/")
     discussions_url = f"{base_url}/api/v1/courses/{course_id}/discussion_topics"
@@ -1790,7 +2901,7 @@ def process_course_discussions(
     if not _should_regenerate_resource(existing_metadata, latest_ts):
         return 0
 
-    print(
+    logger.info(
         f"{'Updating' if existing_metadata else 'New'} discussions for '{course_name}'"
     )
     reports_label = f"{course_name}/Reports"
@@ -1820,8 +2931,7 @@ def process_course_quizzes(
     per_page: int = DEFAULT_CANVAS_PER_PAGE,
     summary: Optional[SummaryCollector] = None,
 ):
-    if session is None:
-        session = requests.Session()
+    session = session or get_shared_session()
 
     base_url = (canvas_api_url or "").rstrip("/")
     quizzes_url = f"{base_url}/api/v1/courses/{course_id}/quizzes"
@@ -1850,7 +2960,9 @@ def process_course_quizzes(
     if not _should_regenerate_resource(existing_metadata, latest_ts):
         return 0
 
-    print(f"{'Updating' if existing_metadata else 'New'} quizzes for '{course_name}'")
+    logger.info(
+        f"{'Updating' if existing_metadata else 'New'} quizzes for '{course_name}'"
+    )
     reports_label = f"{course_name}/Reports"
     return _export_json_resource(
         quizzes,
@@ -1878,8 +2990,7 @@ def process_course_enrollments(
     per_page: int = DEFAULT_CANVAS_PER_PAGE,
     summary: Optional[SummaryCollector] = None,
 ):
-    if session is None:
-        session = requests.Session()
+    session = session or get_shared_session()
 
     base_url = (canvas_api_url or "").rstrip("/")
     enrollments_url = f"{base_url}/api/v1/courses/{course_id}/enrollments"
@@ -1910,7 +3021,7 @@ def process_course_enrollments(
     if not _should_regenerate_resource(existing_metadata, latest_ts):
         return 0
 
-    print(
+    logger.info(
         f"{'Updating' if existing_metadata else 'New'} enrollments for '{course_name}'"
     )
     reports_label = f"{course_name}/Reports"
@@ -1940,8 +3051,7 @@ def process_course_calendar_events(
     per_page: int = DEFAULT_CANVAS_PER_PAGE,
     summary: Optional[SummaryCollector] = None,
 ):
-    if session is None:
-        session = requests.Session()
+    session = session or get_shared_session()
 
     base_url = (canvas_api_url or "").rstrip("/")
     calendar_url = (
@@ -1974,7 +3084,7 @@ def process_course_calendar_events(
     if not _should_regenerate_resource(existing_metadata, latest_ts):
         return 0
 
-    print(
+    logger.info(
         f"{'Updating' if existing_metadata else 'New'} calendar events for '{course_name}'"
     )
     reports_label = f"{course_name}/Reports"
@@ -2004,8 +3114,7 @@ def process_course_groups(
     per_page: int = DEFAULT_CANVAS_PER_PAGE,
     summary: Optional[SummaryCollector] = None,
 ):
-    if session is None:
-        session = requests.Session()
+    session = session or get_shared_session()
 
     base_url = (canvas_api_url or "").rstrip("/")
     groups_url = f"{base_url}/api/v1/courses/{course_id}/groups"
@@ -2034,7 +3143,9 @@ def process_course_groups(
     if not _should_regenerate_resource(existing_metadata, latest_ts):
         return 0
 
-    print(f"{'Updating' if existing_metadata else 'New'} groups for '{course_name}'")
+    logger.info(
+        f"{'Updating' if existing_metadata else 'New'} groups for '{course_name}'"
+    )
     reports_label = f"{course_name}/Reports"
     return _export_json_resource(
         groups,
@@ -2061,8 +3172,7 @@ def process_course_analytics_activity(
     timeout: int = DEFAULT_REQUEST_TIMEOUT,
     summary: Optional[SummaryCollector] = None,
 ):
-    if session is None:
-        session = requests.Session()
+    session = session or get_shared_session()
 
     base_url = (canvas_api_url or "").rstrip("/")
     analytics_url = f"{base_url}/api/v1/courses/{course_id}/analytics/activity"
@@ -2071,7 +3181,7 @@ def process_course_analytics_activity(
         resp.raise_for_status()
         analytics_payload = resp.json()
     except requests.RequestException as e:
-        print(f"Could not fetch analytics for course {course_id}: {e}")
+        logger.warning(f"Could not fetch analytics for course {course_id}: {e}")
         return 0
 
     if not analytics_payload:
@@ -2101,7 +3211,7 @@ def process_course_analytics_activity(
     if not _should_regenerate_resource(existing_metadata, latest_ts):
         return 0
 
-    print(
+    logger.info(
         f"{'Updating' if existing_metadata else 'New'} analytics activity for '{course_name}'"
     )
     reports_label = f"{course_name}/Reports"
@@ -2130,8 +3240,7 @@ def process_course_gradebook_history(
     timeout: int = DEFAULT_REQUEST_TIMEOUT,
     summary: Optional[SummaryCollector] = None,
 ):
-    if session is None:
-        session = requests.Session()
+    session = session or get_shared_session()
 
     base_url = (canvas_api_url or "").rstrip("/")
     history_url = f"{base_url}/api/v1/courses/{course_id}/gradebook_history/feed"
@@ -2140,7 +3249,7 @@ def process_course_gradebook_history(
         resp.raise_for_status()
         history_payload = resp.json()
     except requests.RequestException as e:
-        print(f"Could not fetch gradebook history for course {course_id}: {e}")
+        logger.warning(f"Could not fetch gradebook history for course {course_id}: {e}")
         return 0
 
     if not history_payload:
@@ -2162,7 +3271,7 @@ def process_course_gradebook_history(
     if not _should_regenerate_resource(existing_metadata, latest_ts):
         return 0
 
-    print(
+    logger.info(
         f"{'Updating' if existing_metadata else 'New'} gradebook history for '{course_name}'"
     )
     reports_label = f"{course_name}/Reports"
@@ -2193,8 +3302,7 @@ def process_course_submissions_summary(
     per_page: int = DEFAULT_CANVAS_PER_PAGE,
     summary: Optional[SummaryCollector] = None,
 ):
-    if session is None:
-        session = requests.Session()
+    session = session or get_shared_session()
 
     if not assignments:
         return 0
@@ -2254,7 +3362,7 @@ def process_course_submissions_summary(
     if not _should_regenerate_resource(existing_metadata, latest_ts):
         return 0
 
-    print(
+    logger.info(
         f"{'Updating' if existing_metadata else 'New'} submissions summary for '{course_name}'"
     )
     reports_label = f"{course_name}/Reports"
@@ -2283,8 +3391,7 @@ def process_inbox_conversations(
     summary: Optional[SummaryCollector] = None,
 ):
     """Fetch user inbox conversations (global, not course-specific)."""
-    if session is None:
-        session = requests.Session()
+    session = session or get_shared_session()
 
     base_url = (canvas_api_url or "").rstrip("/")
     conversations_url = f"{base_url}/api/v1/conversations"
@@ -2327,7 +3434,9 @@ def process_inbox_conversations(
     if not _should_regenerate_resource(existing_metadata, latest_ts):
         return 0
 
-    print(f"{'Updating' if existing_metadata else 'New'} inbox conversations archive")
+    logger.info(
+        f"{'Updating' if existing_metadata else 'New'} inbox conversations archive"
+    )
     return _export_json_resource(
         conversations,
         filename,
@@ -2343,14 +3452,26 @@ def process_inbox_conversations(
 
 def main():
     """Main function to run the sync process."""
-    print("--- Starting Canvas to Storage Sync ---")
+    try:
+        _run_sync()
+    finally:
+        # Early returns, errors and Ctrl-C must not leave the staging folder
+        # (and partial downloads) behind in the sync root
+        _remove_download_dir(DOWNLOAD_DIR)
+
+
+def _run_sync():
+    """Runs one sync; main() removes the temp download folder afterwards."""
+    global DOWNLOAD_DIR
+    configure_console_logging()
+    logger.info("--- Starting Canvas to Storage Sync ---")
     summary = SummaryCollector()
 
-    config = configparser.ConfigParser()
     if not os.path.exists(CONFIG_FILE):
-        print(f"ERROR: Config file '{CONFIG_FILE}' not found.")
+        logger.error(f"ERROR: Config file '{CONFIG_FILE}' not found.")
         return
-    config.read(CONFIG_FILE)
+    # Shared with load_last_selection/save_last_selection so the file is parsed once
+    config = _get_config()
 
     try:
         canvas_api_url = config["CANVAS"]["API_URL"]
@@ -2368,12 +3489,12 @@ def main():
         elif storage_type == "local":
             local_root_dir = config["STORAGE"]["LOCAL_ROOT_DIR"]
         else:
-            print(
+            logger.error(
                 f"ERROR: Invalid STORAGE_TYPE '{storage_type}'. Must be 'local' or 'google_drive'"
             )
             return
     except KeyError as e:
-        print(f"ERROR: Missing config key in {CONFIG_FILE}: {e}")
+        logger.error(f"ERROR: Missing config key in {CONFIG_FILE}: {e}")
         return
 
     canvas_headers = {"Authorization": f"Bearer {canvas_api_key}"}
@@ -2387,19 +3508,23 @@ def main():
         root_storage_path = get_or_create_folder(drive_service, drive_root_folder_name)
         if not root_storage_path:
             return
-        print(f"Syncing to Google Drive folder: '{drive_root_folder_name}'")
+        logger.info(f"Syncing to Google Drive folder: '{drive_root_folder_name}'")
+        _sync_state.load(SYNC_STATE_FILE)
     else:  # local storage
         if local_root_dir is None:
-            print("ERROR: LOCAL_ROOT_DIR not configured.")
+            logger.error("ERROR: LOCAL_ROOT_DIR not configured.")
             return
         root_storage_path = os.path.abspath(local_root_dir)
-        if not os.path.exists(root_storage_path):
-            os.makedirs(root_storage_path)
-        print(f"Syncing to local directory: '{root_storage_path}'")
+        os.makedirs(root_storage_path, exist_ok=True)
+        logger.info(f"Syncing to local directory: '{root_storage_path}'")
+        # Keep downloads on the destination volume so saving is a rename, not a copy
+        DOWNLOAD_DIR = os.path.join(root_storage_path, LOCAL_DOWNLOAD_DIR_NAME)
 
-    if os.path.exists(DOWNLOAD_DIR):
-        shutil.rmtree(DOWNLOAD_DIR)
-    os.makedirs(DOWNLOAD_DIR)
+    # Delete leftovers in the background while courses are fetched and selected;
+    # the folder is only recreated once there are courses to sync
+    cleanup_executor = ThreadPoolExecutor(max_workers=1)
+    download_dir_ready = cleanup_executor.submit(_remove_download_dir, DOWNLOAD_DIR)
+    cleanup_executor.shutdown(wait=False)
 
     # Performance tuning from config (optional)
     try:
@@ -2414,6 +3539,8 @@ def main():
         drive_chunk_size_mb = int(
             perf_cfg.get("DRIVE_CHUNK_SIZE_MB", DEFAULT_DRIVE_CHUNK_SIZE_MB)
         )
+        file_workers = int(perf_cfg.get("FILE_WORKERS", DEFAULT_FILE_WORKERS))
+        course_workers = int(perf_cfg.get("COURSE_WORKERS", DEFAULT_COURSE_WORKERS))
     except Exception:
         request_timeout = DEFAULT_REQUEST_TIMEOUT
         max_retries = DEFAULT_MAX_RETRIES
@@ -2421,6 +3548,8 @@ def main():
         canvas_per_page = DEFAULT_CANVAS_PER_PAGE
         http_pool_maxsize = DEFAULT_HTTP_POOL_MAXSIZE
         drive_chunk_size_mb = DEFAULT_DRIVE_CHUNK_SIZE_MB
+        file_workers = DEFAULT_FILE_WORKERS
+        course_workers = DEFAULT_COURSE_WORKERS
 
     # Export toggles
     export_announcements = _get_bool_config(
@@ -2447,30 +3576,15 @@ def main():
     )
 
     # Shared HTTP session with retries and connection pooling
+    session = get_shared_session(max_retries, backoff_factor, http_pool_maxsize)
 
-    session = requests.Session()
-    retries = Retry(
-        total=max_retries,
-        backoff_factor=backoff_factor,
-        status_forcelist=(429, 500, 502, 503, 504),
-        allowed_methods=("GET", "POST", "PUT", "PATCH"),
-        raise_on_status=False,
-    )
-    adapter = HTTPAdapter(
-        max_retries=retries,
-        pool_connections=http_pool_maxsize,
-        pool_maxsize=http_pool_maxsize,
-    )
-    session.mount("http://", adapter)
-    session.mount("https://", adapter)
-
-    print("\nFetching courses from Canvas...")
+    logger.info("\nFetching courses from Canvas...")
     courses_url = f"{canvas_api_url}/api/v1/courses"
     courses = get_paginated_canvas_items(
         courses_url, canvas_headers, session, request_timeout, canvas_per_page
     )
     if not courses:
-        print("No courses found.")
+        logger.info("No courses found.")
         return
 
     # Filter out restricted courses
@@ -2481,7 +3595,7 @@ def main():
     ]
 
     if not available_courses:
-        print("No available courses found (all may be restricted).")
+        logger.info("No available courses found (all may be restricted).")
         return
 
     # Load last selection
@@ -2493,23 +3607,65 @@ def main():
     )
 
     if not selected_courses:
-        print("No courses selected. Exiting.")
+        logger.info("No courses selected. Exiting.")
         return
 
     # Save the selection for next time
     save_last_selection(selected_courses)
 
-    print(f"\nSelected {len(selected_courses)} course(s) to sync.")
-
-    for course in selected_courses:
+    logger.info(f"\nSelected {len(selected_courses)} course(s) to sync.")
+    log_listener = start_background_logging()
+    download_dir_ready.result()
+    os.makedirs(DOWNLOAD_DIR, exist_ok=True)
+
+    # Warm every selected course's listings (and Drive course folders) up front
+    prefetch_executor = ThreadPoolExecutor(max_workers=DEFAULT_PAGINATION_WORKERS)
+    prefetched = prefetch_course_listings(
+        prefetch_executor,
+        selected_courses,
+        canvas_api_url,
+        canvas_headers,
+        session,
+        request_timeout,
+        canvas_per_page,
+    )
+    # Assignment PDFs upload here while the next one is rendered
+    upload_executor = ThreadPoolExecutor(max_workers=max(1, file_workers))
+    # Canvas file downloads/uploads for every course share one long-lived pool, so
+    # each worker thread builds its Drive client once per run
+    file_executor = (
+        ThreadPoolExecutor(max_workers=file_workers * max(1, course_workers))
+        if file_workers > 1
+        else None
+    )
+    course_folder_ids = {}
+    if storage_type == "google_drive":
+        course_folder_ids = ensure_folders(
+            drive_service,
+            [
+                (root_storage_path, course.get("name", "Unnamed"))
+                for course in selected_courses
+            ],
+        )
+        for folder_id in course_folder_ids.values():
+            if folder_id:
+                prefetch_executor.submit(
+                    lambda fid: _get_drive_folder_index(
+                        _get_thread_drive_service(drive_service), fid
+                    ),
+                    folder_id,
+                )
 
+    def sync_course(course, drive_service=drive_service):
+        """Syncs one course; runs on the course pool with its own Drive client."""
+        drive_service = _get_thread_drive_service(drive_service)
         course_name, course_id = course.get("name", "Unnamed"), course.get("id")
 
-        print(f"\n--- Processing Course: {course_name} ---")
+        logger.info(f"\n--- Processing Course: {course_name} ---")
 
         # --- Process Quizzes ---
         if export_quizzes:
-            print("Searching for quizzes...")
+            logger.info("Searching for quizzes...")
             quizzes = get_canvas_quizzes(
                 course_id,
                 session,
@@ -2519,58 +3675,82 @@ def main():
                 per_page=canvas_per_page,
             )
             if quizzes:
-                print(f"Found {len(quizzes)} quizzes in '{course_name}':")
+                logger.info(f"Found {len(quizzes)} quizzes in '{course_name}':")
                 for quiz in quizzes:
                     title = quiz.get("title", "(untitled)")
                     due_at = quiz.get("due_at", "N/A")
                     points = quiz.get("points_possible", "N/A")
-                    print(f"  - {title} | Due: {due_at} | Points: {points}")
+                    logger.info(f"  - {title} | Due: {due_at} | Points: {points}")
             else:
-                print("No quizzes found.")
+                logger.info("No quizzes found.")
 
         if storage_type == "google_drive":
-            course_storage_path = get_or_create_folder(
+            course_storage_path = course_folder_ids.get(
+                (root_storage_path, course_name)
+            ) or get_or_create_folder(
                 drive_service, course_name, parent_id=root_storage_path
             )
             if not course_storage_path:
-                continue
+                return
         else:  # local storage
             course_storage_path = get_or_create_local_folder(
                 local_root_dir, course_name
             )
 
-        # Prepare per-course reports folder for aggregated exports
+        processed_canvas_file_ids = set()
+        new_items_synced = 0
+
+        logger.info("Searching for assignments...")
+        assignments = take_prefetched(prefetched, course_id, "assignments")
+        if assignments is None:
+            assignments_url = f"{canvas_api_url}/api/v1/courses/{course_id}/assignments?include[]=rubric"
+            assignments = get_paginated_canvas_items(
+                assignments_url,
+                canvas_headers,
+                session,
+                request_timeout,
+                canvas_per_page,
+            )
+
+        # Prepare per-course reports folder for aggregated exports (and the
+        # Assignments folder when needed) in one batched Drive round-trip
+        assignment_folder_ids = {}
         if storage_type == "google_drive":
-            reports_folder_path = get_or_create_folder(
-                drive_service, "Reports", parent_id=course_storage_path
+            course_folder_specs = [(course_storage_path, "Reports")]
+            if assignments:
+                course_folder_specs.append((course_storage_path, "Assignments"))
+            course_folders = ensure_folders(drive_service, course_folder_specs)
+            reports_folder_path = course_folders.get((course_storage_path, "Reports"))
+            assignments_folder_path = course_folders.get(
+                (course_storage_path, "Assignments")
             )
+            if assignments and assignments_folder_path:
+                assignment_folder_ids = ensure_folders(
+                    drive_service,
+                    [
+                        (assignments_folder_path, sanitize_filename(a["name"]))
+                        for a in assignments
+                        if a.get("name")
+                    ],
+                )
+                # One listing for all assignment folders instead of one per assignment
+                prefetch_drive_folder_indexes(
+                    drive_service, assignment_folder_ids.values()
+                )
         else:
             reports_folder_path = get_or_create_local_folder(
                 course_storage_path, "Reports"
             )
-
-        processed_canvas_file_ids = set()
-        new_items_synced = 0
+            assignments_folder_path = (
+                get_or_create_local_folder(course_storage_path, "Assignments")
+                if assignments
+                else None
+            )
 
         # --- Process Assignments ---
-        print("Searching for assignments...")
-        assignments_url = (
-            f"{canvas_api_url}/api/v1/courses/{course_id}/assignments?include[]=rubric"
-        )
-        assignments = get_paginated_canvas_items(
-            assignments_url, canvas_headers, session, request_timeout, canvas_per_page
-        )
         if assignments:
-            if storage_type == "google_drive":
-                assignments_folder_path = get_or_create_folder(
-                    drive_service, "Assignments", parent_id=course_storage_path
-                )
-            else:
-                assignments_folder_path = get_or_create_local_folder(
-                    course_storage_path, "Assignments"
-                )
-
             if assignments_folder_path:
+                pending_uploads = []
                 for assignment in assignments:
                     new_items_synced += process_canvas_assignment(
                         assignment,
@@ -2587,52 +3767,146 @@ def main():
                         drive_chunk_size_mb=drive_chunk_size_mb,
                         summary=summary,
                         course_name=course_name,
+                        file_workers=file_workers,
+                        assignment_folder_id=assignment_folder_ids.get(
+                            (
+                                assignments_folder_path,
+                                sanitize_filename(assignment.get("name") or ""),
+                            )
+                        ),
+                        upload_executor=upload_executor,
+                        pending_uploads=pending_uploads,
+                        file_executor=file_executor,
                     )
+                for future in pending_uploads:
+                    try:
+                        new_items_synced += future.result()
+                    except Exception as e:
+                        logger.warning(f"Could not upload assignment PDF: {e}")
 
         # --- Process Modules (Files and Pages) ---
-        print("Searching for files and pages in modules...")
-        modules_url = f"{canvas_api_url}/api/v1/courses/{course_id}/modules"
-        modules = get_paginated_canvas_items(
-            modules_url, canvas_headers, session, request_timeout, canvas_per_page
-        )
+        logger.info("Searching for files and pages in modules...")
+        modules = take_prefetched(prefetched, course_id, "modules")
+        if modules is None:
+            modules_url = f"{canvas_api_url}/api/v1/courses/{course_id}/modules"
+            modules = get_paginated_canvas_items(
+                modules_url, canvas_headers, session, request_timeout, canvas_per_page
+            )
 
-        for module in modules:
+        def list_module_items(module):
             items_url = f"{canvas_api_url}/api/v1/courses/{course_id}/modules/{module['id']}/items"
-            module_items = get_paginated_canvas_items(
+            return get_paginated_canvas_items(
                 items_url, canvas_headers, session, request_timeout, canvas_per_page
             )
 
+        def fetch_item_detail(url):
+            try:
+                resp = session.get(url, headers=canvas_headers, timeout=request_timeout)
+                resp.raise_for_status()
+                return resp.json(), None
+            except requests.exceptions.RequestException as e:
+                return None, e
+
+        # List every module's items at once, then fetch all File/Page details at
+        # once; the results are processed below in module order
+        with ThreadPoolExecutor(max_workers=DEFAULT_PAGE_FETCH_WORKERS) as executor:
+            items_per_module = list(
+                executor.map(_in_log_course(list_module_items), modules)
+            )
+            detail_urls = list(
+                dict.fromkeys(
+                    item["url"]
+                    for module_items in items_per_module
+                    for item in module_items
+                    if item.get("type") in ("File", "Page") and item.get("url")
+                )
+            )
+            item_details = dict(
+                zip(detail_urls, executor.map(fetch_item_detail, detail_urls))
+            )
+
+        # Module files double as lookups for the same files linked from pages
+        for module_items in items_per_module:
+            for item in module_items:
+                if item.get("type") == "File" and item.get("url"):
+                    data = item_details[item["url"]][0]
+                    if data and data.get("id"):
+                        _canvas_file_infos.setdefault(str(data["id"]), data)
+
+        if storage_type == "google_drive":
+            # Resolve every page folder in one batched pass (and list the ones
+            # whose PDF may need updating together) instead of one by one below
+            page_versions = {}
+            for module_items in items_per_module:
+                for item in module_items:
+                    if item.get("type") != "Page" or not item.get("url"):
+                        continue
+                    data = item_details[item["url"]][0]
+                    if data and data.get("title") and data.get("body"):
+                        page_name = sanitize_filename(data["title"])
+                        page_versions.setdefault(page_name, data.get("updated_at"))
+            if page_versions:
+                page_folder_ids = ensure_folders(
+                    drive_service,
+                    [(course_storage_path, name) for name in page_versions],
+                )
+                prefetch_drive_folder_indexes(
+                    drive_service,
+                    [
+                        folder_id
+                        for (_, name), folder_id in page_folder_ids.items()
+                        if folder_id
+                        and not _sync_state.is_unchanged(
+                            folder_id, f"{name}.pdf", page_versions[name]
+                        )
+                    ],
+                )
+
+        # Look up the files linked from module pages in the background so the
+        # page branch below finds them in _canvas_file_infos after each PDF build
+        linked_page_file_ids = [
+            file_id
+            for module_items in items_per_module
+            for item in module_items
+            if item.get("type") == "Page" and item.get("url")
+            for file_id in _FILE_LINK_RE.findall(
+                (item_details[item["url"]][0] or {}).get("body") or ""
+            )
+        ]
+        linked_page_files_ready = (
+            prefetch_executor.submit(
+                _in_log_course(fetch_canvas_file_infos),
+                linked_page_file_ids,
+                canvas_api_url,
+                canvas_headers,
+                session=session,
+                timeout=request_timeout,
+            )
+            if linked_page_file_ids
+            else None
+        )
+
+        def item_detail(item):
+            data, error = item_details[item["url"]]
+            if error is not None:
+                raise error
+            return data
+
+        # Reused by process_course_pages instead of listing every module again
+        all_module_items = []
+        for module_items in items_per_module:
+            all_module_items.extend(module_items)
+
+            module_file_infos = []
             for item in module_items:
                 try:
                     # Case 1: Item is a direct file link
                     if item.get("type") == "File":
-                        file_details_resp = session.get(
-                            item["url"], headers=canvas_headers, timeout=request_timeout
-                        )
-                        file_details_resp.raise_for_status()
-                        new_items_synced += process_canvas_file(
-                            file_details_resp.json(),
-                            course_storage_path,
-                            processed_canvas_file_ids,
-                            canvas_headers,
-                            storage_type,
-                            drive_service,
-                            local_root_dir,
-                            session=session,
-                            timeout=request_timeout,
-                            drive_chunk_size_mb=drive_chunk_size_mb,
-                            summary=summary,
-                            course_name=course_name,
-                            dest_label=f"{course_name}",
-                        )
+                        module_file_infos.append(item_detail(item))
 
                     # Case 2: Item is a Page, which we save as an HTML file
                     elif item.get("type") == "Page":
-                        page_resp = session.get(
-                            item["url"], headers=canvas_headers, timeout=request_timeout
-                        )
-                        page_resp.raise_for_status()
-                        page_data = page_resp.json()
+                        page_data = item_detail(item)
                         page_title = page_data.get("title")
                         html_body = page_data.get("body")
 
@@ -2659,54 +3933,72 @@ def main():
                         pdf_filename = f"{safe_page_title}.pdf"
                         updated_at = page_data.get("updated_at")
 
-                        # Get existing PDF metadata
-                        if storage_type == "google_drive":
-                            existing_metadata = get_existing_file_metadata_drive(
-                                drive_service, page_storage_path, pdf_filename
-                            )
-                        else:
-                            existing_metadata = get_existing_file_metadata_local(
-                                page_storage_path, pdf_filename
+                        # The PDF only depends on the title and body, so edits that
+                        # bump updated_at without touching them keep the old PDF
+                        page_hash = hashlib.blake2b(
+                            f"{page_title}\0{html_body}".encode("utf-8"),
+                            digest_size=16,
+                        ).hexdigest()
+                        existing_metadata = None
+                        page_changed = not _sync_state.is_unchanged(
+                            page_storage_path, pdf_filename, updated_at
+                        )
+                        if page_changed:
+                            # Get existing PDF metadata
+                            if storage_type == "google_drive":
+                                existing_metadata = get_existing_file_metadata_drive(
+                                    drive_service, page_storage_path, pdf_filename
+                                )
+                            else:
+                                existing_metadata = get_existing_file_metadata_local(
+                                    page_storage_path, pdf_filename
+                                )
+                            page_changed = has_file_changed(
+                                existing_metadata, canvas_updated_at=updated_at
                             )
+                            if (
+                                page_changed
+                                and existing_metadata
+                                and _sync_state.content_hash(
+                                    page_storage_path, pdf_filename
+                                )
+                                == page_hash
+                            ):
+                                page_changed = False
 
                         # Check if page has changed
-                        if not has_file_changed(
-                            existing_metadata, canvas_updated_at=updated_at
-                        ):
+                        if not page_changed:
                             # Skip PDF generation, but still process linked files
-                            pass
+                            if storage_type == "google_drive":
+                                _sync_state.record(
+                                    page_storage_path,
+                                    pdf_filename,
+                                    updated_at,
+                                    content_hash=page_hash,
+                                )
                         else:
                             # Create the full HTML content for both HTML and PDF generation
                             full_html = f'<!DOCTYPE html><html><head><meta charset="utf-8"><title>{page_title}</title></head><body>{html_body}</body></html>'
 
-                            print(
+                            logger.info(
                                 f"{'Updating' if existing_metadata else 'New'} page found: '{page_title}'"
                             )
-                            local_pdf_path = os.path.join(DOWNLOAD_DIR, pdf_filename)
                             try:
-                                # Create PDF document
-                                doc = SimpleDocTemplate(local_pdf_path, pagesize=letter)
-                                styles = getSampleStyleSheet()
-
-                                # Create title style
-                                title_style = ParagraphStyle(
-                                    "CustomTitle",
-                                    parent=styles["Heading1"],
-                                    fontSize=16,
-                                    spaceAfter=30,
-                                )
+                                # Build the PDF in memory; no temp file to clean up
+                                pdf_buffer = io.BytesIO()
+                                doc = SimpleDocTemplate(pdf_buffer, pagesize=letter)
 
                                 story = []
 
                                 # Add title
-                                escaped_page_title = html.escape(
-                                    page_title, quote=False
+                                escaped_page_title = _esc(page_title)
+                                story.append(
+                                    Paragraph(escaped_page_title, _TITLE_STYLE)
                                 )
-                                story.append(Paragraph(escaped_page_title, title_style))
                                 story.append(Spacer(1, 12))
 
                                 # Add content with preserved formatting
-                                html_elements = html_to_pdf_elements(full_html, styles)
+                                html_elements = html_to_pdf_elements(full_html, _STYLES)
                                 story.extend(html_elements)
 
                                 doc.build(story)
@@ -2716,22 +4008,24 @@ def main():
                                     if existing_metadata
                                     else None
                                 )
-                                if storage_type == "google_drive":
-                                    success = upload_file_to_drive(
-                                        drive_service,
-                                        local_pdf_path,
-                                        pdf_filename,
-                                        page_storage_path,
-                                        existing_file_id,
-                                    )
-                                else:
-                                    success = save_file_locally(
-                                        local_pdf_path,
-                                        pdf_filename,
-                                        page_storage_path,
-                                    )
+                                success = store_buffer(
+                                    pdf_buffer,
+                                    pdf_filename,
+                                    storage_type,
+                                    page_storage_path,
+                                    drive_service,
+                                    existing_file_id,
+                                    drive_chunk_size_mb=drive_chunk_size_mb,
+                                )
                                 if success:
                                     new_items_synced += 1
+                                    if storage_type == "google_drive":
+                                        _sync_state.record(
+                                            page_storage_path,
+                                            pdf_filename,
+                                            updated_at,
+                                            content_hash=page_hash,
+                                        )
                                     # Record in summary
                                     dest_label = f"{course_name}/{page_folder_name}"
                                     summary.add_file(
@@ -2740,68 +4034,67 @@ def main():
                                         pdf_filename,
                                         "updated" if existing_metadata else "created",
                                     )
-                                # Clean up temporary PDF file
-                                if os.path.exists(local_pdf_path):
-                                    try:
-                                        os.remove(local_pdf_path)
-                                    except OSError as e:
-                                        print(
-                                            f"Warning: Could not remove temporary file '{local_pdf_path}': {e}"
-                                        )
                             except Exception as e:
-                                escaped_error = html.escape(str(e), quote=False)
-                                print(
+                                escaped_error = _esc(str(e))
+                                logger.warning(
                                     f"Could not save page '{page_title}' as PDF: {escaped_error}"
                                 )
-                                # Clean up temporary PDF file if it exists
-                                if os.path.exists(local_pdf_path):
-                                    try:
-                                        os.remove(local_pdf_path)
-                                    except OSError as e:
-                                        print(
-                                            f"Warning: Could not remove temporary file '{local_pdf_path}': {e}"
-                                        )
 
                         # Also scan the page for files
-                        soup = BeautifulSoup(html_body, "html.parser")
-                        for link in soup.find_all("a", href=True):
-                            if not isinstance(link, Tag):
-                                continue
-                            href = link.get("href", "")
-                            if not isinstance(href, str):
-                                continue
-                            match = re.search(r"/files/(\d+)", href)
-                            if match:
-                                file_id_from_page = match.group(1)
-                                file_api_url = (
-                                    f"{canvas_api_url}/api/v1/files/{file_id_from_page}"
-                                )
-                                file_info_resp = session.get(
-                                    file_api_url,
-                                    headers=canvas_headers,
-                                    timeout=request_timeout,
-                                )
-                                if file_info_resp.ok:
-                                    new_items_synced += process_canvas_file(
-                                        file_info_resp.json(),
-                                        page_storage_path,
-                                        processed_canvas_file_ids,
-                                        canvas_headers,
-                                        storage_type,
-                                        drive_service,
-                                        local_root_dir,
-                                        session=session,
-                                        timeout=request_timeout,
-                                        drive_chunk_size_mb=drive_chunk_size_mb,
-                                        summary=summary,
-                                        course_name=course_name,
-                                        dest_label=f"{course_name}/{page_folder_name}",
-                                    )
+                        page_file_ids = _FILE_LINK_RE.findall(html_body)
+                        if page_file_ids and linked_page_files_ready is not None:
+                            wait([linked_page_files_ready])
+                        page_file_infos = fetch_canvas_file_infos(
+                            page_file_ids,
+                            canvas_api_url,
+                            canvas_headers,
+                            session=session,
+                            timeout=request_timeout,
+                        )
+
+                        new_items_synced += process_files_concurrently(
+                            page_file_infos,
+                            page_storage_path,
+                            processed_canvas_file_ids,
+                            canvas_headers,
+                            storage_type,
+                            drive_service,
+                            local_root_dir,
+                            session=session,
+                            timeout=request_timeout,
+                            drive_chunk_size_mb=drive_chunk_size_mb,
+                            summary=summary,
+                            course_name=course_name,
+                            dest_label=f"{course_name}/{page_folder_name}",
+                            max_workers=file_workers,
+                            executor=file_executor,
+                        )
 
                 except requests.exceptions.RequestException as e:
-                    print(f"Could not retrieve details for a module item: {e}")
+                    logger.warning(f"Could not retrieve details for a module item: {e}")
                 except Exception as e:
-                    print(f"An unexpected error occurred processing module item: {e}")
+                    logger.error(
+                        f"An unexpected error occurred processing module item: {e}"
+                    )
+
+            # Download/upload this module's files in parallel
+            new_items_synced += process_files_concurrently(
+                module_file_infos,
+                course_storage_path,
+                processed_canvas_file_ids,
+                canvas_headers,
+                storage_type,
+                drive_service,
+                local_root_dir,
+                session=session,
+                timeout=request_timeout,
+                drive_chunk_size_mb=drive_chunk_size_mb,
+                summary=summary,
+                course_name=course_name,
+                dest_label=f"{course_name}",
+                max_workers=file_workers,
+                executor=file_executor,
+            )
 
         # Merge all course pages into a single PDF
         try:
@@ -2817,9 +4110,11 @@ def main():
                 timeout=request_timeout,
                 per_page=canvas_per_page,
                 summary=summary,
+                pages_from_api=take_prefetched(prefetched, course_id, "pages"),
+                module_items=all_module_items,
             )
         except Exception as e:
-            print(f"Error merging course pages for '{course_name}': {e}")
+            logger.error(f"Error merging course pages for '{course_name}': {e}")
 
         # --- Course-level reports and exports ---
         if reports_folder_path:
@@ -2839,7 +4134,9 @@ def main():
                         summary=summary,
                     )
                 except Exception as e:
-                    print(f"Error exporting announcements for '{course_name}': {e}")
+                    logger.error(
+                        f"Error exporting announcements for '{course_name}': {e}"
+                    )
 
             if export_discussions:
                 try:
@@ -2857,7 +4154,9 @@ def main():
                         summary=summary,
                     )
                 except Exception as e:
-                    print(f"Error exporting discussions for '{course_name}': {e}")
+                    logger.error(
+                        f"Error exporting discussions for '{course_name}': {e}"
+                    )
 
             if export_quizzes:
                 try:
@@ -2875,7 +4174,7 @@ def main():
                         summary=summary,
                     )
                 except Exception as e:
-                    print(f"Error exporting quizzes for '{course_name}': {e}")
+                    logger.error(f"Error exporting quizzes for '{course_name}': {e}")
 
             if export_enrollments:
                 try:
@@ -2893,7 +4192,9 @@ def main():
                         summary=summary,
                     )
                 except Exception as e:
-                    print(f"Error exporting enrollments for '{course_name}': {e}")
+                    logger.error(
+                        f"Error exporting enrollments for '{course_name}': {e}"
+                    )
 
             if export_calendar_events:
                 try:
@@ -2911,7 +4212,9 @@ def main():
                         summary=summary,
                     )
                 except Exception as e:
-                    print(f"Error exporting calendar events for '{course_name}': {e}")
+                    logger.error(
+                        f"Error exporting calendar events for '{course_name}': {e}"
+                    )
 
             if export_groups:
                 try:
@@ -2929,7 +4232,7 @@ def main():
                         summary=summary,
                     )
                 except Exception as e:
-                    print(f"Error exporting groups for '{course_name}': {e}")
+                    logger.error(f"Error exporting groups for '{course_name}': {e}")
 
             if export_analytics:
                 try:
@@ -2946,7 +4249,7 @@ def main():
                         summary=summary,
                     )
                 except Exception as e:
-                    print(f"Error exporting analytics for '{course_name}': {e}")
+                    logger.error(f"Error exporting analytics for '{course_name}': {e}")
 
             if export_gradebook:
                 try:
@@ -2963,7 +4266,9 @@ def main():
                         summary=summary,
                     )
                 except Exception as e:
-                    print(f"Error exporting gradebook history for '{course_name}': {e}")
+                    logger.error(
+                        f"Error exporting gradebook history for '{course_name}': {e}"
+                    )
 
             if export_submissions:
                 try:
@@ -2982,14 +4287,40 @@ def main():
                         summary=summary,
                     )
                 except Exception as e:
-                    print(f"Error exporting submissions for '{course_name}': {e}")
+                    logger.error(
+                        f"Error exporting submissions for '{course_name}': {e}"
+                    )
 
         if new_items_synced == 0:
-            print(
+            logger.info(
                 "All discoverable files, pages, assignments, and reports for this course are already up to date."
             )
         else:
-            print(f"Synced/updated {new_items_synced} item(s) for '{course_name}'.")
+            logger.info(
+                f"Synced/updated {new_items_synced} item(s) for '{course_name}'."
+            )
+
+    # Courses are independent, so several are walked at once on the pooled session
+    concurrent_courses = max(1, min(course_workers, len(selected_courses)))
+
+    def sync_course_logged(course):
+        """Runs sync_course, tagging its log lines when courses interleave."""
+        name = course.get("name", "Unnamed") if concurrent_courses > 1 else None
+        with log_course(name):
+            sync_course(course)
+
+    with ThreadPoolExecutor(max_workers=concurrent_courses) as course_executor:
+        course_futures = {
+            course_executor.submit(sync_course_logged, course): course
+            for course in selected_courses
+        }
+        for future, course in course_futures.items():
+            try:
+                future.result()
+            except Exception as e:
+                logger.error(
+                    f"Error syncing course '{course.get('name', 'Unnamed')}': {e}"
+                )
 
     # Global (user-level) inbox conversations archive
     if export_inbox:
@@ -3006,15 +4337,24 @@ def main():
                 summary=summary,
             )
             if inbox_changes:
-                print(f"Archived {inbox_changes} inbox conversation export(s).")
+                logger.info(f"Archived {inbox_changes} inbox conversation export(s).")
         except Exception as e:
-            print(f"Error exporting inbox conversations: {e}")
+            logger.error(f"Error exporting inbox conversations: {e}")
+
+    prefetch_executor.shutdown(wait=False, cancel_futures=True)
+    upload_executor.shutdown()
+    if file_executor is not None:
+        file_executor.shutdown()
+    if storage_type == "google_drive":
+        _sync_state.save(SYNC_STATE_FILE)
+
+    stop_background_logging(log_listener)
 
     # Print summary before cleanup
     summary.print_summary()
 
-    shutil.rmtree(DOWNLOAD_DIR)
-    print("\n--- Sync Complete ---")
+    _remove_download_dir(DOWNLOAD_DIR)
+    logger.info("\n--- Sync Complete ---")
 
     # Prevent automatic exit so users can read the summary, especially when double-clicking an exe
     try:
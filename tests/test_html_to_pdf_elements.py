@@ -0,0 +1,117 @@
+"""Regression tests for the lxml-based HTML to ReportLab converter.
+
+Expected markup was captured from the original BeautifulSoup converter, so
+these samples pin the output of the iterwalk rewrite to the old behavior.
+"""
+
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import main  # noqa: E402
+
+
+def render(html_content):
+    """Summarize converter output as (kind, text, style name) tuples."""
+    result = []
+    for recipe in main._html_to_pdf_recipe(html_content, main._STYLES):
+        if recipe[0] == "para":
+            result.append(("para", recipe[1], recipe[2].name))
+        elif recipe[0] == "list":
+            result.append(("list", [text for text, _ in recipe[1]], recipe[2]))
+        else:
+            result.append(recipe)
+    return result
+
+
+B = '<font name="Helvetica-Bold" size="10">{}</font>'
+LI = '<font name="Helvetica" size="10">{}</font>'
+
+
+@pytest.mark.parametrize(
+    "html_content, expected",
+    [
+        (
+            "<h1>Title</h1><p>Hello <b>bold</b> and <i>it</i> &amp; more</p>",
+            [
+                ("para", '<font name="Helvetica-Bold" size="18">Title</font>', "h1"),
+                ("spacer", 12),
+                (
+                    "para",
+                    "Hello "
+                    + B.format("bold")
+                    + ' and <font name="Helvetica-Oblique" size="10">it</font>'
+                    + " &amp; more",
+                    "Normal",
+                ),
+                ("spacer", 6),
+            ],
+        ),
+        (
+            "<ul><li>one</li><li>two <b>b</b></li></ul><ol><li>first</li></ol>",
+            [
+                ("list", [LI.format("one"), LI.format("two ") + B.format("b")], "ul"),
+                ("spacer", 6),
+                ("list", [LI.format("first")], "ol"),
+                ("spacer", 6),
+            ],
+        ),
+        (
+            "loose text<br>next<p>para</p>tail",
+            [
+                ("para", "loose text<br/>next", "Normal"),
+                ("spacer", 6),
+                ("para", "para", "Normal"),
+                ("spacer", 6),
+                ("para", "tail", "Normal"),
+            ],
+        ),
+    ],
+)
+def test_matches_original_converter(html_content, expected):
+    assert render(html_content) == expected
+
+
+@pytest.mark.parametrize(
+    "html_content, expected",
+    [
+        (
+            "<p>Intro<!-- x --> important instructions here.</p>",
+            [("para", "Intro important instructions here.", "Normal"), ("spacer", 6)],
+        ),
+        ("<p>a<?pi x?>b</p>", [("para", "ab", "Normal"), ("spacer", 6)]),
+        (
+            "top<!-- c -->tail<p>x</p>",
+            [
+                ("para", "toptail", "Normal"),
+                ("spacer", 6),
+                ("para", "x", "Normal"),
+                ("spacer", 6),
+            ],
+        ),
+        (
+            "<ul><!-- c --><li>a<!-- c -->b</li></ul>",
+            [("list", [LI.format("a") + LI.format("b")], "ul"), ("spacer", 6)],
+        ),
+        (
+            "<p><b>bo<!-- c -->ld</b> rest</p>",
+            [
+                ("para", B.format("bo") + B.format("ld") + " rest", "Normal"),
+                ("spacer", 6),
+            ],
+        ),
+    ],
+)
+def test_keeps_text_after_comments_and_processing_instructions(html_content, expected):
+    assert render(html_content) == expected
+
+
+def test_flowables_are_built_fresh_from_cached_recipe():
+    first = main.html_to_pdf_elements("<p>Repeated</p>", main._STYLES)
+    second = main.html_to_pdf_elements("<p>Repeated</p>", main._STYLES)
+    assert [type(f).__name__ for f in first] == ["Paragraph", "Spacer"]
+    assert first[0] is not second[0]
+    assert first[0].text == second[0].text == "Repeated"
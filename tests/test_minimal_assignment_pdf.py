@@ -0,0 +1,118 @@
+"""Checks that title-only assignment PDFs look the same with and without ReportLab."""
+
+import base64
+import os
+import re
+import sys
+import zlib
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import main  # noqa: E402
+
+
+def _stream_data(raw, header):
+    """Undo the ASCII85/Flate filters ReportLab applies to content streams."""
+    if b"/ASCII85Decode" in header:
+        raw = base64.a85decode(raw.strip(), adobe=True)
+    if b"/FlateDecode" in header:
+        raw = zlib.decompress(raw)
+    return raw
+
+
+def _unescape(literal):
+    """Decode a PDF string literal's backslash and octal escapes."""
+    return re.sub(
+        r"\\([0-7]{1,3}|.)",
+        lambda m: chr(int(m.group(1), 8)) if m.group(1).isdigit() else m.group(1),
+        literal,
+    )
+
+
+def text_runs(pdf):
+    """Return (x, y, [(base font, size, text), ...]) for each text object.
+
+    Understands the operators both writers emit: q/Q, translation-only cm,
+    BT/ET, Tm, Td, Tf and Tj.
+    """
+    objects = dict(re.findall(rb"(\d+) 0 obj(.*?)endobj", pdf, re.S))
+    fonts = {}
+    for name, number in re.findall(rb"/(F\d+) (\d+) 0 R", pdf):
+        base = re.search(rb"/BaseFont /([\w-]+)", objects.get(number, b""))
+        if base:
+            fonts[name.decode()] = base.group(1).decode()
+
+    runs = []
+    for header, raw in re.findall(
+        rb"<<([^>]*?)>>\s*stream\r?\n(.*?)endstream", pdf, re.S
+    ):
+        if b"/Subtype" in header:
+            continue
+        content = _stream_data(raw, header).decode("latin-1")
+        tokens = re.findall(r"\((?:\\.|[^\\)])*\)|[^\s()]+", content)
+        stack, origin, operands = [], (0.0, 0.0), []
+        font = size = None
+        for token in tokens:
+            if token.startswith("("):
+                operands.append(_unescape(token[1:-1]))
+            elif re.fullmatch(r"-?[\d.]+", token) or token.startswith("/"):
+                operands.append(token)
+            else:
+                if token == "q":
+                    stack.append(origin)
+                elif token == "Q":
+                    origin = stack.pop()
+                elif token == "cm":
+                    origin = (
+                        origin[0] + float(operands[4]),
+                        origin[1] + float(operands[5]),
+                    )
+                elif token == "BT":
+                    line = list(origin)
+                    current = None
+                elif token in ("Tm", "Td"):
+                    dx, dy = float(operands[-2]), float(operands[-1])
+                    line = [origin[0] + dx, origin[1] + dy]
+                elif token == "Tf":
+                    font, size = fonts[operands[-2][1:]], float(operands[-1])
+                elif token == "Tj":
+                    if current is None:
+                        current = (round(line[0], 2), round(line[1], 2), [])
+                        runs.append(current)
+                    current[2].append((font, size, operands[-1]))
+                operands = []
+    return runs
+
+
+def render_assignment(tmp_path, monkeypatch, fast_path, name):
+    monkeypatch.setattr(main, "MINIMAL_ASSIGNMENT_PDF_FAST_PATH", fast_path)
+    root = tmp_path / ("fast" if fast_path else "full")
+    root.mkdir()
+    count = main.process_canvas_assignment(
+        {"name": name, "updated_at": "2024-01-01T00:00:00Z"},
+        str(root),
+        set(),
+        "https://canvas.test",
+        {},
+        "local",
+        local_root_dir=str(root),
+    )
+    assert count == 1
+    path = root / main.sanitize_filename(name) / f"{main.sanitize_filename(name)}.pdf"
+    return path.read_bytes()
+
+
+@pytest.mark.parametrize("name", ["Homework 1", "Essay (draft) \\ final", "Café"])
+def test_fast_path_matches_reportlab_layout(tmp_path, monkeypatch, name):
+    assert main._minimal_assignment_pdf(name) is not None
+    fast = text_runs(render_assignment(tmp_path, monkeypatch, True, name))
+    full = text_runs(render_assignment(tmp_path, monkeypatch, False, name))
+    assert fast == full
+    assert [run[2][0][2] for run in fast] == [name, "Due:", "Points:"]
+
+
+@pytest.mark.parametrize("name", ["Unicode → title", "Two  spaces", "W" * 60])
+def test_falls_back_when_template_cannot_match(name):
+    assert main._minimal_assignment_pdf(name) is None